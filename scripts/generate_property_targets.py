@@ -11,9 +11,16 @@ Usage:
 import argparse
 import csv
 import hashlib
+import mmap
+import os
+import shutil
 import sys
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from operator import itemgetter
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, TextIO, Tuple
 from collections import Counter
 
 
@@ -49,6 +56,45 @@ INSTITUTIONAL_KEYWORDS = [
     "MERRILL LYNCH", "FIDELITY", "VANGUARD"
 ]
 
+# Entity suffixes used by detect_owner_type, precomputed as " SUFFIX" search
+# patterns (a ", SUFFIX" or trailing suffix always contains " SUFFIX")
+LLC_SUFFIX_PATTERNS = tuple(f" {suffix}" for suffix in ["LLC", "L.L.C.", "L L C"])
+CORPORATE_SUFFIX_PATTERNS = tuple(
+    f" {suffix}" for suffix in ["INC", "INCORPORATED", "CORP", "CORPORATION", "LTD", "LIMITED",
+                                "LP", "L.P.", "LLP", "L.L.P.", "PC", "P.C.", "PLLC"]
+)
+
+# Seconds between progress lines while processing rows
+PROGRESS_INTERVAL_SECONDS = 2.0
+
+# Characters removed from amount strings before parsing ("$1,234" -> "1234")
+AMOUNT_STRIP_TABLE = str.maketrans("", "", "$, ")
+
+# Output columns shared by the targets, review, discard, and bucket files
+OUTPUT_COLUMNS = [
+    "lead_id", "full_name", "company_name", "owner_type",
+    "mailing_address", "mailing_city", "mailing_state", "mailing_zip",
+    "situs_address", "situs_city", "situs_state", "situs_zip",
+    "tcad_account_id", "owner_occupied_guess", "total_value",
+    "property_type", "lead_score", "why_flagged"
+]
+
+
+class TCADRow(NamedTuple):
+    """Stripped prop_clean.csv fields used to classify a property."""
+    account_id: str
+    owner_name: str
+    mailing_address: str
+    mailing_city: str
+    mailing_state: str
+    mailing_zip: str
+    situs_address: str
+    situs_city: str
+    situs_state: str
+    situs_zip: str
+    property_type: str
+    total_value: str
+
 
 # ============================================================================
 # HELPER FUNCTIONS
@@ -100,17 +146,11 @@ def detect_owner_type(owner_name: str) -> str:
         return "TRUST"
     
     # Check for LLC
-    if any(name_upper.endswith(f" {suffix}") or name_upper.endswith(f", {suffix}") or 
-           f" {suffix}" in name_upper or f", {suffix}" in name_upper
-           for suffix in ["LLC", "L.L.C.", "L L C"]):
+    if any(pattern in name_upper for pattern in LLC_SUFFIX_PATTERNS):
         return "LLC"
     
     # Check for other corporate entities
-    corporate_suffixes = ["INC", "INCORPORATED", "CORP", "CORPORATION", "LTD", "LIMITED", 
-                          "LP", "L.P.", "LLP", "L.L.P.", "PC", "P.C.", "PLLC"]
-    if any(name_upper.endswith(f" {suffix}") or name_upper.endswith(f", {suffix}") or
-           f" {suffix}" in name_upper or f", {suffix}" in name_upper
-           for suffix in corporate_suffixes):
+    if any(pattern in name_upper for pattern in CORPORATE_SUFFIX_PATTERNS):
         return "LLC"  # Treat other corps as LLC
     
     # If contains comma, likely a person (LAST, FIRST format)
@@ -127,21 +167,19 @@ def detect_owner_type(owner_name: str) -> str:
 
 def parse_amount(amount_str: str) -> Optional[float]:
     """Parse amount from string."""
-    if not amount_str or not amount_str.strip():
+    if not amount_str:
         return None
     
-    cleaned = amount_str.strip().replace("$", "").replace(",", "").replace(" ", "")
-    
     try:
-        return float(cleaned)
-    except (ValueError, AttributeError):
+        return float(amount_str.translate(AMOUNT_STRIP_TABLE))
+    except ValueError:
         return None
 
 
-def is_absentee_owner(row: Dict[str, str]) -> bool:
+def is_absentee_owner(row: TCADRow) -> bool:
     """Check if owner is absentee (mailing address != situs address)."""
-    mailing = normalize_address(row.get("mailing_address", ""))
-    situs = normalize_address(row.get("situs_address", ""))
+    mailing = normalize_address(row.mailing_address)
+    situs = normalize_address(row.situs_address)
     
     if not mailing or not situs:
         return False
@@ -244,11 +282,11 @@ def generate_lead_id(owner_name: str, account_id: str, mailing_zip: str) -> str:
 
 
 def classify_property_row(
-    row: Dict[str, str],
+    row: TCADRow,
     min_value: float,
     max_value: float,
     only_absentee: bool
-) -> Tuple[str, str, int, str]:
+) -> Tuple[str, str, int, str, Optional[float]]:
     """
     Classify a property row as TARGET, REVIEW, or DISCARD.
     
@@ -259,43 +297,43 @@ def classify_property_row(
         only_absentee: Only include absentee owners
         
     Returns:
-        Tuple of (classification, owner_type, lead_score, why_flagged)
+        Tuple of (classification, owner_type, lead_score, why_flagged, total_value).
+        total_value is None if the row was rejected before the value was parsed.
     """
-    owner_name = row.get("owner_name", "").strip()
+    owner_name = row.owner_name
     
     # Hard-exclude institutional owners
     if is_institutional_owner(owner_name):
-        return ("DISCARD", "INSTITUTIONAL", 0, "Institutional/bank owner")
+        return ("DISCARD", "INSTITUTIONAL", 0, "Institutional/bank owner", None)
     
     # Detect owner type
     owner_type = detect_owner_type(owner_name)
     
     # If UNKNOWN and no other indicators, review
     if owner_type == "UNKNOWN" and not owner_name:
-        return ("DISCARD", owner_type, 0, "Missing owner name")
+        return ("DISCARD", owner_type, 0, "Missing owner name", None)
     
     # Check absentee status
     is_absentee = is_absentee_owner(row)
     
     if only_absentee and not is_absentee:
-        return ("DISCARD", owner_type, 0, "Not absentee owner (only_absentee=true)")
+        return ("DISCARD", owner_type, 0, "Not absentee owner (only_absentee=true)", None)
     
     # Check property value
-    total_value_str = row.get("total_value", "")
-    total_value = parse_amount(total_value_str)
+    total_value = parse_amount(row.total_value)
     
     if total_value is None:
-        return ("REVIEW", owner_type, 0, "Missing total_value")
+        return ("REVIEW", owner_type, 0, "Missing total_value", None)
     
     if total_value <= 0:
-        return ("DISCARD", owner_type, 0, f"Invalid total_value: {total_value}")
+        return ("DISCARD", owner_type, 0, f"Invalid total_value: {total_value}", total_value)
     
     # Value range check
     if total_value < min_value:
-        return ("REVIEW", owner_type, 0, f"Value below minimum ({total_value:,.0f} < {min_value:,.0f})")
+        return ("REVIEW", owner_type, 0, f"Value below minimum ({total_value:,.0f} < {min_value:,.0f})", total_value)
     
     if total_value > max_value:
-        return ("REVIEW", owner_type, 0, f"Value above maximum ({total_value:,.0f} > {max_value:,.0f})")
+        return ("REVIEW", owner_type, 0, f"Value above maximum ({total_value:,.0f} > {max_value:,.0f})", total_value)
     
     # Calculate lead score
     lead_score, why_flagged = calculate_lead_score(
@@ -303,17 +341,15 @@ def classify_property_row(
     )
     
     # All checks passed - this is a TARGET
-    return ("TARGET", owner_type, lead_score, why_flagged)
+    return ("TARGET", owner_type, lead_score, why_flagged, total_value)
 
 
-def build_target_row(row: Dict[str, str], owner_type: str, lead_score: int, why_flagged: str) -> Dict[str, str]:
-    """Build output row for target."""
-    owner_name = row.get("owner_name", "").strip()
-    account_id = row.get("account_id", "").strip()
-    mailing_zip = row.get("mailing_zip", "").strip()
+def build_target_row(row: TCADRow, owner_type: str, lead_score: int, why_flagged: str) -> List[str]:
+    """Build output row for target (values in OUTPUT_COLUMNS order)."""
+    owner_name = row.owner_name
     
     # Generate lead_id
-    lead_id = generate_lead_id(owner_name, account_id, mailing_zip)
+    lead_id = generate_lead_id(owner_name, row.account_id, row.mailing_zip)
     
     # Determine full_name vs company_name
     full_name = owner_name if owner_type == "PERSON" else ""
@@ -323,28 +359,58 @@ def build_target_row(row: Dict[str, str], owner_type: str, lead_score: int, why_
     is_absentee = is_absentee_owner(row)
     owner_occupied_guess = "N" if is_absentee else "Y"
     
-    output_row = {
-        "lead_id": lead_id,
-        "full_name": full_name,
-        "company_name": company_name,
-        "owner_type": owner_type,
-        "mailing_address": row.get("mailing_address", "").strip(),
-        "mailing_city": row.get("mailing_city", "").strip(),
-        "mailing_state": row.get("mailing_state", "").strip(),
-        "mailing_zip": mailing_zip,
-        "situs_address": row.get("situs_address", "").strip(),
-        "situs_city": row.get("situs_city", "").strip(),
-        "situs_state": row.get("situs_state", "").strip(),
-        "situs_zip": row.get("situs_zip", "").strip(),
-        "tcad_account_id": account_id,
-        "owner_occupied_guess": owner_occupied_guess,
-        "total_value": row.get("total_value", "").strip(),
-        "property_type": row.get("property_type", "").strip(),
-        "lead_score": str(lead_score),
-        "why_flagged": why_flagged
-    }
+    return [
+        lead_id,
+        full_name,
+        company_name,
+        owner_type,
+        row.mailing_address,
+        row.mailing_city,
+        row.mailing_state,
+        row.mailing_zip,
+        row.situs_address,
+        row.situs_city,
+        row.situs_state,
+        row.situs_zip,
+        row.account_id,
+        owner_occupied_guess,
+        row.total_value,
+        row.property_type,
+        str(lead_score),
+        why_flagged
+    ]
+
+
+def build_discard_row(row: TCADRow, owner_type: str, why_flagged: str) -> List[str]:
+    """
+    Build output row for a discarded property.
     
-    return output_row
+    Discarded rows are only kept for auditing, so the computed fields
+    (lead_id and owner_occupied_guess) are left blank. This skips the SHA1
+    hash and address normalization for the largest output file.
+    """
+    owner_name = row.owner_name
+    
+    return [
+        "",
+        owner_name if owner_type == "PERSON" else "",
+        owner_name if owner_type in ["LLC", "TRUST"] else "",
+        owner_type,
+        row.mailing_address,
+        row.mailing_city,
+        row.mailing_state,
+        row.mailing_zip,
+        row.situs_address,
+        row.situs_city,
+        row.situs_state,
+        row.situs_zip,
+        row.account_id,
+        "",
+        row.total_value,
+        row.property_type,
+        "0",
+        why_flagged
+    ]
 
 
 def get_value_bucket(total_value: Optional[float]) -> str:
@@ -356,86 +422,160 @@ def get_value_bucket(total_value: Optional[float]) -> str:
     return f"{bucket}k-{bucket+100000}k"
 
 
-def process_tcad_file(
-    tcad_path: Path,
-    output_dir: Path,
+def get_bucket_names(min_value: float, max_value: float) -> List[str]:
+    """Get names of the value buckets (100k steps) between min and max value."""
+    bucket_names = []
+    for bucket_start in range(0, int(max_value), 100000):
+        if bucket_start < min_value:
+            continue
+        bucket_names.append(f"{bucket_start}k-{bucket_start + 100000}k")
+    return bucket_names
+
+
+def open_output_files(
+    paths: Dict[str, Path],
+    write_header: bool = True
+) -> Tuple[Dict[str, TextIO], Dict]:
+    """
+    Open one CSV writer per output path.
+    
+    Args:
+        paths: Mapping of output name -> file path
+        write_header: Write the header row to each file
+        
+    Returns:
+        Tuple of (files, writers), both keyed by output name
+    """
+    files = {}
+    writers = {}
+    for name, path in paths.items():
+        files[name] = open(path, 'w', newline='', encoding='utf-8')
+        writers[name] = csv.writer(files[name])
+        if write_header:
+            writers[name].writerow(OUTPUT_COLUMNS)
+    return files, writers
+
+
+def read_tcad_rows(reader: Iterable[List[str]], fieldnames: List[str]) -> Iterator[TCADRow]:
+    """
+    Convert csv.reader rows into TCADRow records.
+    
+    Column positions are resolved once from the header; a repeated column
+    name reads its last occurrence (as csv.DictReader did). Columns missing
+    from the file (or from a short row) are read as blank.
+    
+    Args:
+        reader: csv.reader over the data rows (header already consumed)
+        fieldnames: Header columns of the TCAD file
+        
+    Yields:
+        TCADRow with stripped values
+    """
+    # Missing columns point at a blank slot after the last header column
+    column_index = {column: i for i, column in enumerate(fieldnames)}
+    blank_index = len(fieldnames)
+    indices = [column_index.get(field, blank_index) for field in TCADRow._fields]
+    width = max(indices) + 1
+    get_fields = itemgetter(*indices)
+    make_row = TCADRow._make
+    
+    for row in reader:
+        if not row:
+            continue  # Skip blank lines (as csv.DictReader does)
+        if len(row) < width:
+            row += [""] * (width - len(row))
+        elif width > blank_index:
+            # Drop fields past the header (csv.DictReader kept them under
+            # None) so the blank slot for missing columns stays blank
+            row[blank_index:] = [""]
+        yield make_row(map(str.strip, get_fields(row)))
+
+
+def format_progress(counts: Dict[str, int]) -> str:
+    """Format a progress line from a snapshot of the running counts."""
+    return (f"Processed {sum(counts.values()):,} rows... (targets: {counts['targets']:,}, "
+            f"review: {counts['review']:,}, discarded: {counts['discarded']:,})")
+
+
+def start_progress_heartbeat(
+    counts: Dict[str, int],
+    interval: float = PROGRESS_INTERVAL_SECONDS
+) -> Tuple[threading.Event, threading.Thread]:
+    """
+    Print the running counts from a background thread every interval seconds.
+    
+    Keeps progress reporting (and its stdout I/O) out of the row loop, which
+    only has to update counts. Each report copies counts in one step, so the
+    numbers on a line agree with each other while the loop keeps writing.
+    
+    Args:
+        counts: Counts dict updated by the row loop
+        interval: Seconds between progress lines
+        
+    Returns:
+        Tuple of (stop event, thread); set the event, then join the thread
+    """
+    stop = threading.Event()
+    
+    def report():
+        while not stop.wait(interval):
+            print(format_progress(dict(counts)))
+    
+    thread = threading.Thread(target=report, daemon=True)
+    thread.start()
+    return stop, thread
+
+
+def classify_rows(
+    rows: Iterable[TCADRow],
+    writers: Dict,
+    bucket_writers: Dict,
     min_value: float,
     max_value: float,
     only_absentee: bool,
-    enable_bucketing: bool = False
-) -> Dict[str, int]:
+    enable_bucketing: bool,
+    show_progress: bool = True
+) -> Tuple[Dict[str, int], Counter]:
     """
-    Process TCAD file and generate property targets.
+    Classify property rows and write each to the matching output writer.
     
     Args:
-        tcad_path: Path to prop_clean.csv
-        output_dir: Output directory
+        rows: Property rows
+        writers: Writers keyed by "targets", "review", and "discarded"
+        bucket_writers: Writers keyed by value bucket name
         min_value: Minimum property value
         max_value: Maximum property value
         only_absentee: Only include absentee owners
         enable_bucketing: Enable value bucketing
+        show_progress: Print progress from a background heartbeat thread
         
     Returns:
-        Dictionary with counts
+        Tuple of (counts, owner_type_counter)
     """
-    output_dir.mkdir(parents=True, exist_ok=True)
-    
-    targets_path = output_dir / "property_targets_email_ready.csv"
-    review_path = output_dir / "property_targets_review.csv"
-    discard_path = output_dir / "property_targets_discarded.csv"
-    
-    # Define output columns
-    output_columns = [
-        "lead_id", "full_name", "company_name", "owner_type",
-        "mailing_address", "mailing_city", "mailing_state", "mailing_zip",
-        "situs_address", "situs_city", "situs_state", "situs_zip",
-        "tcad_account_id", "owner_occupied_guess", "total_value",
-        "property_type", "lead_score", "why_flagged"
-    ]
-    
-    # Open output files
-    targets_file = open(targets_path, 'w', newline='', encoding='utf-8')
-    review_file = open(review_path, 'w', newline='', encoding='utf-8')
-    discard_file = open(discard_path, 'w', newline='', encoding='utf-8')
-    
-    targets_writer = csv.DictWriter(targets_file, fieldnames=output_columns)
-    review_writer = csv.DictWriter(review_file, fieldnames=output_columns)
-    discard_writer = csv.DictWriter(discard_file, fieldnames=output_columns)
+    counts = {"targets": 0, "review": 0, "discarded": 0}
+    owner_type_counter = Counter()
     
-    targets_writer.writeheader()
-    review_writer.writeheader()
-    discard_writer.writeheader()
+    targets_writer = writers["targets"]
+    review_writer = writers["review"]
+    discard_writer = writers["discarded"]
     
-    # Bucketing files (if enabled)
-    bucket_files = {}
-    bucket_writers = {}
+    # Choose the target writer once, so the row loop has no bucketing branch
     if enable_bucketing:
-        for bucket_start in range(0, int(max_value), 100000):
-            bucket_end = bucket_start + 100000
-            if bucket_start < min_value:
-                continue
-            bucket_name = f"{bucket_start}k-{bucket_end}k"
-            bucket_path = output_dir / f"property_targets_{bucket_name}.csv"
-            bucket_file = open(bucket_path, 'w', newline='', encoding='utf-8')
-            bucket_writer = csv.DictWriter(bucket_file, fieldnames=output_columns)
-            bucket_writer.writeheader()
-            bucket_files[bucket_name] = bucket_file
-            bucket_writers[bucket_name] = bucket_writer
-    
-    # Process rows
-    counts = {"targets": 0, "review": 0, "discarded": 0}
-    owner_type_counter = Counter()
+        def write_target(target_row: List[str], total_value: float):
+            targets_writer.writerow(target_row)
+            bucket_writer = bucket_writers.get(get_value_bucket(total_value))
+            if bucket_writer is not None:
+                bucket_writer.writerow(target_row)
+    else:
+        def write_target(target_row: List[str], total_value: float):
+            targets_writer.writerow(target_row)
     
-    print(f"Processing {tcad_path}...")
-    print(f"Filters: min_value={min_value:,.0f}, max_value={max_value:,.0f}, only_absentee={only_absentee}")
-    print()
+    heartbeat = start_progress_heartbeat(counts) if show_progress else None
     
-    with open(tcad_path, 'r', encoding='utf-8', errors='replace') as f:
-        reader = csv.DictReader(f)
-        
-        for row_num, row in enumerate(reader, start=2):  # Start at 2 (header is row 1)
+    try:
+        for row in rows:
             # Classify row
-            classification, owner_type, lead_score, why_flagged = classify_property_row(
+            classification, owner_type, lead_score, why_flagged, total_value = classify_property_row(
                 row, min_value, max_value, only_absentee
             )
             
@@ -445,42 +585,248 @@ def process_tcad_file(
             # Build output row
             if classification == "TARGET":
                 target_row = build_target_row(row, owner_type, lead_score, why_flagged)
-                targets_writer.writerow(target_row)
+                write_target(target_row, total_value)
                 counts["targets"] += 1
-                
-                # Write to bucket file if enabled
-                if enable_bucketing:
-                    total_value = parse_amount(row.get("total_value", ""))
-                    bucket = get_value_bucket(total_value)
-                    if bucket in bucket_writers:
-                        bucket_writers[bucket].writerow(target_row)
-                
             elif classification == "REVIEW":
                 target_row = build_target_row(row, owner_type, lead_score, why_flagged)
                 review_writer.writerow(target_row)
                 counts["review"] += 1
             else:  # DISCARD
-                target_row = build_target_row(row, owner_type, lead_score, why_flagged)
-                discard_writer.writerow(target_row)
+                discard_writer.writerow(build_discard_row(row, owner_type, why_flagged))
                 counts["discarded"] += 1
-            
-            # Progress update
-            if row_num % 100000 == 0:
-                print(f"Processed {row_num:,} rows... (targets: {counts['targets']:,}, "
-                      f"review: {counts['review']:,}, discarded: {counts['discarded']:,})")
+    finally:
+        if heartbeat is not None:
+            stop_heartbeat, heartbeat_thread = heartbeat
+            stop_heartbeat.set()
+            heartbeat_thread.join()
+            print(format_progress(counts))
     
-    # Close files
-    targets_file.close()
-    review_file.close()
-    discard_file.close()
+    return counts, owner_type_counter
+
+
+def has_multiline_fields(csv_path: Path) -> bool:
+    """
+    Check whether any quoted field in a CSV file spans more than one line.
     
-    if enable_bucketing:
-        for bucket_file in bucket_files.values():
-            bucket_file.close()
+    Chunks are split at raw newlines, which is only safe when every newline
+    ends a row. A line with an odd number of quote characters opens a field
+    that continues on the next line (doubled quotes inside a field pair up).
+    A stray quote in an unquoted field also counts, which errs on the safe side.
+    
+    Args:
+        csv_path: Path to the CSV file
+        
+    Returns:
+        True if some line has an unbalanced quote character
+    """
+    with open(csv_path, 'rb') as f:
+        return any(line.count(b'"') % 2 for line in f)
+
+
+def find_chunk_offsets(tcad_path: Path, num_chunks: int) -> List[int]:
+    """
+    Split the data rows of a CSV file into byte ranges aligned to line starts.
+    
+    Line starts are only row starts when no quoted field spans lines; callers
+    check has_multiline_fields() first.
+    
+    Args:
+        tcad_path: Path to prop_clean.csv
+        num_chunks: Desired number of chunks
+        
+    Returns:
+        Sorted list of byte offsets; chunk i spans offsets[i] to offsets[i+1].
+        The first offset is the start of the first data row (after the header).
+    """
+    with open(tcad_path, 'rb') as f:
+        header_end = len(f.readline())
+        file_size = os.fstat(f.fileno()).st_size
+        if file_size <= header_end:
+            return [header_end, header_end]
+        
+        offsets = [header_end]
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            chunk_size = (file_size - header_end) // num_chunks
+            for i in range(1, num_chunks):
+                split = max(offsets[-1], header_end + i * chunk_size)
+                newline = mm.find(b"\n", split)
+                if newline == -1 or newline + 1 >= file_size:
+                    break
+                if newline + 1 > offsets[-1]:
+                    offsets.append(newline + 1)
+        offsets.append(file_size)
+    
+    return offsets
+
+
+def iter_lines(path: Path, start: int, end: int) -> Iterator[str]:
+    """Yield decoded lines from a file, starting at byte offset start and stopping at end."""
+    with open(path, 'rb') as f:
+        f.seek(start)
+        position = start
+        while position < end:
+            line = f.readline()
+            if not line:
+                break
+            position += len(line)
+            yield line.decode('utf-8', errors='replace')
+
+
+def process_chunk(
+    tcad_path: Path,
+    start: int,
+    end: int,
+    fieldnames: List[str],
+    chunk_dir: Path,
+    params: Dict
+) -> Tuple[Dict[str, Path], Dict[str, int], Counter]:
+    """
+    Worker: classify the rows in one byte range of the TCAD file.
+    
+    Partial outputs are written without headers so they can be concatenated
+    in chunk order.
+    
+    Args:
+        tcad_path: Path to prop_clean.csv
+        start: Byte offset of the first line in the chunk
+        end: Byte offset just past the last line in the chunk
+        fieldnames: Header columns of the TCAD file
+        chunk_dir: Directory for this chunk's partial output files
+        params: Keyword arguments for classify_rows (filter settings)
+        
+    Returns:
+        Tuple of (partial file paths keyed by output name, counts, owner_type_counter)
+    """
+    chunk_dir.mkdir(parents=True, exist_ok=True)
+    
+    output_names = ["targets", "review", "discarded"]
+    if params["enable_bucketing"]:
+        output_names += get_bucket_names(params["min_value"], params["max_value"])
+    paths = {name: chunk_dir / f"{name}.csv" for name in output_names}
+    
+    files, writers = open_output_files(paths, write_header=False)
+    try:
+        reader = read_tcad_rows(csv.reader(iter_lines(tcad_path, start, end)), fieldnames)
+        bucket_writers = {name: writers[name] for name in output_names[3:]}
+        counts, owner_type_counter = classify_rows(
+            reader, writers, bucket_writers, show_progress=False, **params
+        )
+    finally:
+        for file in files.values():
+            file.close()
+    
+    return paths, counts, owner_type_counter
+
+
+def process_tcad_file(
+    tcad_path: Path,
+    output_dir: Path,
+    min_value: float,
+    max_value: float,
+    only_absentee: bool,
+    enable_bucketing: bool = False,
+    workers: int = 1
+) -> Dict[str, int]:
+    """
+    Process TCAD file and generate property targets.
+    
+    Args:
+        tcad_path: Path to prop_clean.csv
+        output_dir: Output directory
+        min_value: Minimum property value
+        max_value: Maximum property value
+        only_absentee: Only include absentee owners
+        enable_bucketing: Enable value bucketing
+        workers: Number of worker processes (rows are split into one chunk per worker)
+        
+    Returns:
+        Dictionary with counts
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    
+    paths = {
+        "targets": output_dir / "property_targets_email_ready.csv",
+        "review": output_dir / "property_targets_review.csv",
+        "discarded": output_dir / "property_targets_discarded.csv",
+    }
+    
+    # Bucketing files (if enabled)
+    bucket_names = get_bucket_names(min_value, max_value) if enable_bucketing else []
+    for bucket_name in bucket_names:
+        paths[bucket_name] = output_dir / f"property_targets_{bucket_name}.csv"
+    
+    params = {
+        "min_value": min_value,
+        "max_value": max_value,
+        "only_absentee": only_absentee,
+        "enable_bucketing": enable_bucketing,
+    }
+    
+    print(f"Processing {tcad_path}...")
+    print(f"Filters: min_value={min_value:,.0f}, max_value={max_value:,.0f}, only_absentee={only_absentee}")
+    print()
+    
+    # Chunks split at raw newlines would cut multi-line quoted fields apart
+    if workers > 1 and has_multiline_fields(tcad_path):
+        print("Quoted fields span multiple lines; using 1 worker")
+        print()
+        workers = 1
+    
+    # Open output files
+    files, writers = open_output_files(paths)
+    bucket_writers = {name: writers[name] for name in bucket_names}
+    
+    try:
+        if workers <= 1:
+            with open(tcad_path, 'r', encoding='utf-8', errors='replace') as f:
+                reader = csv.reader(f)
+                fieldnames = next(reader, [])
+                rows = read_tcad_rows(reader, fieldnames)
+                counts, owner_type_counter = classify_rows(rows, writers, bucket_writers, **params)
+        else:
+            # Split rows into line-aligned byte ranges and classify them in parallel
+            with open(tcad_path, 'r', encoding='utf-8', errors='replace', newline='') as f:
+                fieldnames = next(csv.reader(f), [])
+            offsets = find_chunk_offsets(tcad_path, workers)
+            
+            counts = {"targets": 0, "review": 0, "discarded": 0}
+            owner_type_counter = Counter()
+            
+            with tempfile.TemporaryDirectory(dir=output_dir) as tmp_dir:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    futures = [
+                        executor.submit(
+                            process_chunk, tcad_path, start, end, fieldnames,
+                            Path(tmp_dir) / f"chunk_{i}", params
+                        )
+                        for i, (start, end) in enumerate(zip(offsets, offsets[1:]))
+                    ]
+                    
+                    # Concatenate partial outputs in chunk order
+                    for i, future in enumerate(futures, start=1):
+                        chunk_paths, chunk_counts, chunk_owner_types = future.result()
+                        for name, chunk_path in chunk_paths.items():
+                            files[name].flush()
+                            with open(chunk_path, 'r', newline='', encoding='utf-8') as chunk_file:
+                                shutil.copyfileobj(chunk_file, files[name])
+                        for key, value in chunk_counts.items():
+                            counts[key] += value
+                        owner_type_counter.update(chunk_owner_types)
+                        print(f"Finished chunk {i}/{len(futures)} (targets: {counts['targets']:,}, "
+                              f"review: {counts['review']:,}, discarded: {counts['discarded']:,})")
+    finally:
+        # Close files
+        for file in files.values():
+            file.close()
     
     return counts, owner_type_counter
 
 
+def parse_bool_flag(value: str) -> bool:
+    """Parse a true/false command-line value (true/1/yes are true)."""
+    return value.lower() in {"true", "1", "yes"}
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -529,18 +875,26 @@ Examples:
     
     parser.add_argument(
         "--only_absentee",
-        type=str,
+        type=parse_bool_flag,
         default="false",
         help="Only include absentee owners (true/false, default: false)"
     )
     
     parser.add_argument(
         "--enable_bucketing",
-        type=str,
+        type=parse_bool_flag,
         default="false",
         help="Enable value bucketing into 100k steps (true/false, default: false)"
     )
     
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes (0 = one per CPU, default: 1; "
+             "input with multi-line quoted fields always uses 1)"
+    )
+    
     args = parser.parse_args()
     
     # Validate inputs
@@ -551,9 +905,9 @@ Examples:
     
     output_dir = Path(args.outdir)
     
-    # Parse boolean flags
-    only_absentee = args.only_absentee.lower() in ["true", "1", "yes"]
-    enable_bucketing = args.enable_bucketing.lower() in ["true", "1", "yes"]
+    only_absentee = args.only_absentee
+    enable_bucketing = args.enable_bucketing
+    workers = args.workers if args.workers > 0 else (os.cpu_count() or 1)
     
     print("=" * 70)
     print("PROPERTY TARGETS GENERATOR (TCAD-ONLY)")
@@ -566,6 +920,7 @@ Examples:
     print(f"Max value: ${args.max_value:,.0f}")
     print(f"Only absentee: {only_absentee}")
     print(f"Value bucketing: {enable_bucketing}")
+    print(f"Workers: {workers}")
     print()
     
     counts, owner_type_counter = process_tcad_file(
@@ -574,7 +929,8 @@ Examples:
         min_value=args.min_value,
         max_value=args.max_value,
         only_absentee=only_absentee,
-        enable_bucketing=enable_bucketing
+        enable_bucketing=enable_bucketing,
+        workers=workers
     )
     
     print()
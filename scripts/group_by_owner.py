@@ -12,7 +12,11 @@ import argparse
 import csv
 import sys
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Optional
+
+
+# Characters removed from amount strings before parsing ("$1,234" -> "1234")
+AMOUNT_STRIP_TABLE = str.maketrans("", "", "$, ")
 
 
 def normalize_owner_key(row: Dict[str, str]) -> str:
@@ -41,8 +45,11 @@ def group_properties_by_owner(
     """
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
-    # Group properties by owner
-    owner_groups: Dict[str, List[Dict[str, str]]] = {}
+    # Aggregate properties by owner in a single pass. Only the first row of
+    # each owner is kept (as the base record) alongside running totals, so
+    # memory scales with unique owners rather than total properties.
+    owner_groups: Dict[str, Dict] = {}
+    total_properties = 0
     
     print(f"Loading and grouping properties from {input_path}...")
     
@@ -51,13 +58,30 @@ def group_properties_by_owner(
         input_columns = list(reader.fieldnames or [])
         
         for row in reader:
+            total_properties += 1
             owner_key = normalize_owner_key(row)
-            if owner_key not in owner_groups:
-                owner_groups[owner_key] = []
-            owner_groups[owner_key].append(row)
+            group = owner_groups.get(owner_key)
+            if group is None:
+                group = {"base_row": row, "count": 0, "property_ids": [], "total_value": 0}
+                owner_groups[owner_key] = group
+            
+            group["count"] += 1
+            
+            # Collect property IDs (limit to first 10)
+            tcad_id = row.get("tcad_account_id", "").strip()
+            if tcad_id and len(group["property_ids"]) < 10:
+                group["property_ids"].append(tcad_id)
+            
+            # Accumulate portfolio value
+            cleaned = row.get("total_value", "").translate(AMOUNT_STRIP_TABLE).strip()
+            if cleaned:
+                try:
+                    group["total_value"] += float(cleaned)
+                except ValueError:
+                    pass
     
     print(f"Found {len(owner_groups):,} unique owners")
-    print(f"Total properties: {sum(len(props) for props in owner_groups.values()):,}")
+    print(f"Total properties: {total_properties:,}")
     print()
     
     # Create output columns
@@ -86,36 +110,23 @@ def group_properties_by_owner(
         writer = csv.DictWriter(outfile, fieldnames=output_columns)
         writer.writeheader()
         
-        for owner_key, properties in owner_groups.items():
-            counts["total_properties"] += len(properties)
+        for owner_key, group in owner_groups.items():
+            property_count = group["count"]
+            counts["total_properties"] += property_count
             
-            if len(properties) == 1:
+            if property_count == 1:
                 counts["single_property"] += 1
             else:
                 counts["multiple_properties"] += 1
             
             # Use first property as base record
-            base_row = dict(properties[0])
+            base_row = dict(group["base_row"])
             
             # Aggregate information
-            property_count = len(properties)
             base_row["property_count_actual"] = str(property_count)
+            base_row["property_ids"] = " | ".join(group["property_ids"])
             
-            # Collect property IDs
-            property_ids = [p.get("tcad_account_id", "").strip() for p in properties if p.get("tcad_account_id", "").strip()]
-            base_row["property_ids"] = " | ".join(property_ids[:10])  # Limit to first 10
-            
-            # Calculate total portfolio value
-            total_portfolio_value = 0
-            for prop in properties:
-                total_value_str = prop.get("total_value", "").strip()
-                try:
-                    cleaned = total_value_str.replace("$", "").replace(",", "").replace(" ", "")
-                    if cleaned:
-                        total_portfolio_value += float(cleaned)
-                except (ValueError, AttributeError):
-                    pass
-            
+            total_portfolio_value = group["total_value"]
             base_row["total_portfolio_value"] = f"{int(total_portfolio_value):,}" if total_portfolio_value > 0 else ""
             
             # Update engagement score if multiple properties (boost score)
@@ -7,26 +7,81 @@ and other metrics.
 
 Usage:
     python scripts/group_investor_entities.py
+    python scripts/group_investor_entities.py --workers 0   # one process per CPU
 """
 
+import argparse
 import csv
+import os
+import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 from collections import Counter
 
+from generate_property_targets import find_chunk_offsets, has_multiline_fields, iter_lines
 
-def normalize_entity_name(row: Dict[str, str]) -> str:
+
+# Characters removed from amount strings before parsing ("$1,234" -> "1234")
+AMOUNT_STRIP_TABLE = str.maketrans("", "", "$, ")
+
+# Punctuation dropped from entity names before grouping ("L.L.C." -> "LLC",
+# "SMITH,JOHN" / "SMITH&JONES" -> separate words)
+ENTITY_PUNCTUATION_TABLE = str.maketrans(",&", "  ", ".'")
+
+# Entity suffixes and filler words ignored when grouping, so "Smith Family
+# Trust", "SMITH FAMILY TRUST LLC" and "SMITH FAMILY TR." share a key
+ENTITY_SUFFIX_PATTERN = re.compile(
+    r"\b(?:LLC|INC|INCORPORATED|CORP|CORPORATION|TRUST|TR|LTD|LP|LLP|CO|COMPANY"
+    r"|FAMILY|REVOCABLE|LIVING|THE)\b"
+)
+
+# Property IDs / addresses listed per consolidated entity; the rest are
+# summarized as "... (+N more)"
+MAX_LISTED_PROPERTY_IDS = 20
+MAX_LISTED_PROPERTY_ADDRESSES = 5
+
+# Input columns reduced by summarize_property, in argument order
+SUMMARY_FIELDS = [
+    "tcad_account_id",
+    "situs_address",
+    "situs_city",
+    "total_value",
+    "engagement_score",
+    "has_email",
+    "has_phone"
+]
+
+
+def normalize_entity_name(company_name: str, full_name: str) -> str:
     """
     Create a normalized key for grouping entities.
     
-    Uses: company_name (preferred) or full_name, normalized to uppercase.
+    Uses: company_name (preferred) or full_name, normalized to uppercase with
+    punctuation and entity suffixes (LLC, INC, TRUST, FAMILY, THE, ...)
+    removed. The key is only used for grouping; output rows keep the names
+    from each entity's first record.
     """
-    company_name = row.get("company_name", "").strip().upper()
-    full_name = row.get("full_name", "").strip().upper()
+    company_name = company_name.strip().upper()
+    full_name = full_name.strip().upper()
     
-    # Prefer company_name, fallback to full_name
-    entity_name = company_name if company_name else full_name
+    # Prefer company_name, fallback to full_name; drop punctuation. A name
+    # that is only punctuation (e.g. "&") falls through to the next one, and
+    # if both are, the untranslated name is kept so the row is still grouped
+    for name in (company_name, full_name):
+        entity_name = name.translate(ENTITY_PUNCTUATION_TABLE)
+        if entity_name.strip():
+            break
+    else:
+        entity_name = company_name if company_name else full_name
+    
+    # Drop entity suffixes, unless the name is nothing but suffixes
+    # (e.g. "THE TRUST")
+    stripped_name = ENTITY_SUFFIX_PATTERN.sub(" ", entity_name)
+    if stripped_name.strip():
+        entity_name = stripped_name
     
     # Normalize: remove extra spaces, standardize
     entity_name = " ".join(entity_name.split())
@@ -36,50 +91,248 @@ def normalize_entity_name(row: Dict[str, str]) -> str:
 
 def parse_amount(amount_str: str) -> Optional[float]:
     """Parse amount from string."""
-    if not amount_str or not amount_str.strip():
+    if not amount_str:
         return None
     
-    cleaned = amount_str.strip().replace("$", "").replace(",", "").replace(" ", "")
-    
     try:
-        return float(cleaned)
-    except (ValueError, AttributeError):
+        return float(amount_str.translate(AMOUNT_STRIP_TABLE))
+    except ValueError:
         return None
 
 
+def summarize_property(
+    tcad_account_id: str,
+    situs_address: str,
+    situs_city: str,
+    total_value: str,
+    engagement_score: str,
+    has_email: str,
+    has_phone: str
+) -> Tuple[str, str, float, int, bool, bool]:
+    """
+    Reduce a property row's raw column values to the pre-parsed values used
+    for aggregation.
+    
+    String values are interned so repeated account IDs and addresses share
+    one object across the grouped rows.
+    
+    Returns:
+        Tuple of (tcad_account_id, situs address, total_value, engagement_score,
+        has_email, has_phone). Blank values are "" / 0 / False.
+    """
+    situs_addr = situs_address.strip()
+    situs_city = situs_city.strip()
+    if situs_addr:
+        address = sys.intern(f"{situs_addr}, {situs_city}" if situs_city else situs_addr)
+    else:
+        address = ""
+    
+    return (
+        sys.intern(tcad_account_id.strip()),
+        address,
+        parse_amount(total_value) or 0,
+        int(engagement_score or "0"),
+        has_email in ("Y", "y"),
+        has_phone in ("Y", "y")
+    )
+
+
+def aggregate_entities(rows: Iterable[List[str]], input_columns: List[str]) -> Tuple[List[str], List[Dict]]:
+    """
+    Fold property rows into one running-total record per entity.
+    
+    Only the first row of each entity is kept in full, as the base record;
+    the rest are folded into running totals.
+    
+    Args:
+        rows: csv.reader rows (header already consumed)
+        input_columns: Header columns of the input file
+        
+    Returns:
+        Tuple of (entity keys, entity totals), both in order of first
+        appearance
+    """
+    width = len(input_columns)
+    
+    # Resolve column positions once. A repeated column name reads its last
+    # occurrence (as csv.DictReader did); missing columns point at a blank
+    # padding slot after the last input column
+    column_index = {column: i for i, column in enumerate(input_columns)}
+    get_name_fields = itemgetter(column_index.get("company_name", width), column_index.get("full_name", width))
+    get_summary_fields = itemgetter(*(column_index.get(field, width) for field in SUMMARY_FIELDS))
+    padding = [""] * (width + 1)
+    
+    # Entities are numbered in order of first appearance and their totals
+    # kept in a list indexed by that ID. IDs are cached for each normalized
+    # key, and for each distinct (company_name, full_name) pair so repeated
+    # owners are normalized once (-1 = no name).
+    entity_groups: List[Dict] = []
+    key_ids: Dict[str, int] = {}
+    entity_ids: Dict[Tuple[str, str], int] = {}
+    
+    for row in rows:
+        if not row:
+            continue  # Skip blank lines (as csv.DictReader does)
+        if len(row) <= width:
+            row += padding[len(row):]
+        else:
+            # Drop fields past the header (csv.DictReader kept them under
+            # None) so the padding slot stays blank
+            row[width:] = [""]
+        
+        names = get_name_fields(row)
+        entity_id = entity_ids.get(names)
+        if entity_id is None:
+            entity_key = normalize_entity_name(*names)
+            entity_id = key_ids.setdefault(entity_key, len(key_ids)) if entity_key else -1
+            entity_ids[names] = entity_id
+        if entity_id < 0:
+            # Skip rows with no name
+            continue
+        
+        if entity_id < len(entity_groups):
+            group = entity_groups[entity_id]
+        else:
+            group = {
+                "base_row": row,
+                "count": 0,
+                "property_ids": [],
+                "property_id_overflow": 0,
+                "property_addresses": [],
+                "property_address_overflow": 0,
+                "total_value": 0,
+                "max_engagement_score": 0,
+                "has_email": False,
+                "has_phone": False
+            }
+            entity_groups.append(group)
+        
+        tcad_id, addr_str, total_value, engagement_score, email, phone = summarize_property(*get_summary_fields(row))
+        group["count"] += 1
+        # Only the listed IDs/addresses are kept; the rest are counted
+        if tcad_id:
+            if len(group["property_ids"]) < MAX_LISTED_PROPERTY_IDS:
+                group["property_ids"].append(tcad_id)
+            else:
+                group["property_id_overflow"] += 1
+        if addr_str:
+            if len(group["property_addresses"]) < MAX_LISTED_PROPERTY_ADDRESSES:
+                group["property_addresses"].append(addr_str)
+            else:
+                group["property_address_overflow"] += 1
+        if total_value:
+            group["total_value"] += total_value
+        if engagement_score > group["max_engagement_score"]:
+            group["max_engagement_score"] = engagement_score
+        if email:
+            group["has_email"] = True
+        if phone:
+            group["has_phone"] = True
+    
+    return list(key_ids), entity_groups
+
+
+def aggregate_chunk(input_path: Path, start: int, end: int, input_columns: List[str]) -> Tuple[List[str], List[Dict]]:
+    """Worker: aggregate_entities over the rows in one byte range of the input file."""
+    return aggregate_entities(csv.reader(iter_lines(input_path, start, end)), input_columns)
+
+
+def merge_entity_groups(
+    entity_ids: Dict[str, int],
+    entity_groups: List[Dict],
+    chunk_keys: List[str],
+    chunk_groups: List[Dict]
+):
+    """
+    Merge one chunk's entity totals into the combined totals.
+    
+    Chunks must be merged in file order, so base records, listed IDs and
+    addresses, and entity order all match a single pass over the file.
+    
+    Args:
+        entity_ids: Combined entity key -> index into entity_groups (updated)
+        entity_groups: Combined entity totals (updated)
+        chunk_keys: Entity keys from aggregate_entities for the chunk
+        chunk_groups: Entity totals from aggregate_entities for the chunk
+    """
+    listed_fields = [
+        ("property_ids", "property_id_overflow", MAX_LISTED_PROPERTY_IDS),
+        ("property_addresses", "property_address_overflow", MAX_LISTED_PROPERTY_ADDRESSES)
+    ]
+    
+    for entity_key, chunk_group in zip(chunk_keys, chunk_groups):
+        entity_id = entity_ids.get(entity_key)
+        if entity_id is None:
+            entity_ids[entity_key] = len(entity_groups)
+            entity_groups.append(chunk_group)
+            continue
+        
+        group = entity_groups[entity_id]
+        group["count"] += chunk_group["count"]
+        for field, overflow_field, limit in listed_fields:
+            values = group[field] + chunk_group[field]
+            group[field] = values[:limit]
+            group[overflow_field] += chunk_group[overflow_field] + max(0, len(values) - limit)
+        group["total_value"] += chunk_group["total_value"]
+        if chunk_group["max_engagement_score"] > group["max_engagement_score"]:
+            group["max_engagement_score"] = chunk_group["max_engagement_score"]
+        group["has_email"] = group["has_email"] or chunk_group["has_email"]
+        group["has_phone"] = group["has_phone"] or chunk_group["has_phone"]
+
+
 def group_entities_by_name(
     input_path: Path,
-    output_path: Path
+    output_path: Path,
+    workers: int = 1
 ) -> Dict[str, int]:
     """
     Group entities by name and create consolidated records.
     
+    Args:
+        input_path: Path to note_broker_investor_priority.csv
+        output_path: Path for the grouped output
+        workers: Number of worker processes (rows are split into one chunk per worker)
+        
     Returns:
         Dictionary with counts
     """
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
-    # Group properties by entity name
-    entity_groups: Dict[str, List[Dict[str, str]]] = {}
-    
     print(f"Loading and grouping entities from {input_path}...")
     
-    with open(input_path, 'r', encoding='utf-8', errors='replace') as f:
-        reader = csv.DictReader(f)
-        input_columns = list(reader.fieldnames or [])
+    # Chunks split at raw newlines would cut multi-line quoted fields apart
+    # (csv.writer quotes names that contain a line break)
+    if workers > 1 and has_multiline_fields(input_path):
+        print("Quoted fields span multiple lines; using 1 worker")
+        workers = 1
+    
+    if workers <= 1:
+        with open(input_path, 'r', encoding='utf-8', errors='replace') as f:
+            reader = csv.reader(f)
+            input_columns = next(reader, [])
+            _, entity_groups = aggregate_entities(reader, input_columns)
+    else:
+        # Split rows into line-aligned byte ranges, aggregate them in
+        # parallel and merge the per-chunk totals in file order
+        with open(input_path, 'r', encoding='utf-8', errors='replace', newline='') as f:
+            input_columns = next(csv.reader(f), [])
+        offsets = find_chunk_offsets(input_path, workers)
+        entity_ids: Dict[str, int] = {}
+        entity_groups = []
         
-        for row in reader:
-            entity_key = normalize_entity_name(row)
-            if not entity_key:
-                # Skip rows with no name
-                continue
-                
-            if entity_key not in entity_groups:
-                entity_groups[entity_key] = []
-            entity_groups[entity_key].append(row)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(aggregate_chunk, input_path, start, end, input_columns)
+                for start, end in zip(offsets, offsets[1:])
+            ]
+            for i, future in enumerate(futures, start=1):
+                merge_entity_groups(entity_ids, entity_groups, *future.result())
+                print(f"Finished chunk {i}/{len(futures)} ({len(entity_groups):,} entities so far)")
+    
+    width = len(input_columns)
     
     print(f"Found {len(entity_groups):,} unique entities")
-    print(f"Total property records: {sum(len(props) for props in entity_groups.values()):,}")
+    print(f"Total property records: {sum(group['count'] for group in entity_groups):,}")
     print()
     
     # Create output columns
@@ -101,6 +354,32 @@ def group_entities_by_name(
         if field not in output_columns:
             output_columns.append(field)
     
+    # Output positions of the fields filled in per entity (the last
+    # occurrence of a repeated name)
+    output_index = {column: i for i, column in enumerate(output_columns)}
+    (
+        properties_count_idx,
+        total_portfolio_value_idx,
+        avg_property_value_idx,
+        property_ids_idx,
+        property_addresses_idx,
+        max_engagement_score_idx,
+        has_any_email_idx,
+        has_any_phone_idx
+    ) = [output_index[field] for field in aggregated_fields]
+    engagement_score_idx = output_index.get("engagement_score")
+    property_count_idx = output_index.get("property_count")
+    why_flagged_idx = output_index.get("why_flagged")
+    
+    # Repeated column names (e.g. a re-grouped file) repeat the value at the
+    # name's last position, as they did when rows were written by name
+    repeated_columns = [
+        (i, output_index[column])
+        for i, column in enumerate(output_columns)
+        if output_index[column] != i
+    ]
+    aggregated_padding = [""] * (len(output_columns) - width)
+    
     counts = {
         "total_entities": len(entity_groups),
         "single_property": 0,
@@ -112,98 +391,82 @@ def group_entities_by_name(
     print()
     
     with open(output_path, 'w', newline='', encoding='utf-8') as outfile:
-        writer = csv.DictWriter(outfile, fieldnames=output_columns)
-        writer.writeheader()
+        writer = csv.writer(outfile)
+        writer.writerow(output_columns)
+        
+        show_progress = len(entity_groups) > 1000
         
-        for entity_key, properties in entity_groups.items():
-            property_count = len(properties)
+        for processed, group in enumerate(entity_groups, 1):
+            property_count = group["count"]
             counts["total_properties"] += property_count
             
-            if property_count == 1:
-                counts["single_property"] += 1
-            else:
-                counts["multiple_properties"] += 1
-            
             # Use first property as base record
-            base_row = dict(properties[0])
+            base_row = group["base_row"][:width] + aggregated_padding
             
-            # Aggregate information
-            base_row["properties_count"] = str(property_count)
+            # Aggregate information (count text is reused below)
+            property_count_str = str(property_count)
+            base_row[properties_count_idx] = property_count_str
             
-            # Collect property IDs and addresses
-            property_ids = []
-            property_addresses = []
-            total_portfolio_value = 0
-            max_engagement_score = 0
-            has_any_email = False
-            has_any_phone = False
+            total_portfolio_value = group["total_value"]
+            max_engagement_score = group["max_engagement_score"]
+            has_any_email = group["has_email"]
+            has_any_phone = group["has_phone"]
             
-            for prop in properties:
-                # Property IDs
-                tcad_id = prop.get("tcad_account_id", "").strip()
-                if tcad_id:
-                    property_ids.append(tcad_id)
+            portfolio_value = f"{int(total_portfolio_value):,}" if total_portfolio_value > 0 else ""
+            base_row[total_portfolio_value_idx] = portfolio_value
+            
+            if property_count == 1:
+                counts["single_property"] += 1
+                
+                # Single property (most entities): the average is the total
+                # and there is at most one ID/address, so nothing to join
+                base_row[avg_property_value_idx] = portfolio_value
+                base_row[property_ids_idx] = group["property_ids"][0] if group["property_ids"] else ""
+                base_row[property_addresses_idx] = group["property_addresses"][0] if group["property_addresses"] else ""
+            else:
+                counts["multiple_properties"] += 1
                 
-                # Property addresses
-                situs_addr = prop.get("situs_address", "").strip()
-                situs_city = prop.get("situs_city", "").strip()
-                if situs_addr:
-                    addr_str = f"{situs_addr}, {situs_city}" if situs_city else situs_addr
-                    property_addresses.append(addr_str)
+                # Set aggregated fields
+                avg_value = total_portfolio_value / property_count
+                base_row[avg_property_value_idx] = f"{int(avg_value):,}" if avg_value > 0 else ""
                 
-                # Portfolio value
-                total_value = parse_amount(prop.get("total_value", ""))
-                if total_value:
-                    total_portfolio_value += total_value
+                base_row[property_ids_idx] = " | ".join(group["property_ids"])
+                if group["property_id_overflow"]:
+                    base_row[property_ids_idx] += f" ... (+{group['property_id_overflow']} more)"
                 
-                # Engagement score
-                engagement_score = int(prop.get("engagement_score", "0") or "0")
-                max_engagement_score = max(max_engagement_score, engagement_score)
+                base_row[property_addresses_idx] = " | ".join(group["property_addresses"])
+                if group["property_address_overflow"]:
+                    base_row[property_addresses_idx] += f" ... (+{group['property_address_overflow']} more)"
                 
-                # Contact info
-                if prop.get("has_email", "").upper() == "Y":
-                    has_any_email = True
-                if prop.get("has_phone", "").upper() == "Y":
-                    has_any_phone = True
-            
-            # Set aggregated fields
-            base_row["total_portfolio_value"] = f"{int(total_portfolio_value):,}" if total_portfolio_value > 0 else ""
-            
-            avg_value = total_portfolio_value / property_count if property_count > 0 else 0
-            base_row["avg_property_value"] = f"{int(avg_value):,}" if avg_value > 0 else ""
-            
-            base_row["property_ids"] = " | ".join(property_ids[:20])  # Limit to first 20
-            if len(property_ids) > 20:
-                base_row["property_ids"] += f" ... (+{len(property_ids) - 20} more)"
+                # Update why_flagged to reflect consolidation
+                if why_flagged_idx is not None:
+                    why_flagged = base_row[why_flagged_idx].strip()
+                    if why_flagged:
+                        base_row[why_flagged_idx] = f"{why_flagged} | {property_count_str} properties consolidated"
+                    else:
+                        base_row[why_flagged_idx] = f"{property_count_str} properties consolidated"
             
-            base_row["property_addresses"] = " | ".join(property_addresses[:5])  # Limit to first 5
-            if len(property_addresses) > 5:
-                base_row["property_addresses"] += f" ... (+{len(property_addresses) - 5} more)"
-            
-            base_row["max_engagement_score"] = str(max_engagement_score)
-            base_row["has_any_email"] = "Y" if has_any_email else "N"
-            base_row["has_any_phone"] = "Y" if has_any_phone else "N"
+            # Score text is written to both score columns
+            max_engagement_score_str = str(max_engagement_score)
+            base_row[max_engagement_score_idx] = max_engagement_score_str
+            base_row[has_any_email_idx] = "Y" if has_any_email else "N"
+            base_row[has_any_phone_idx] = "Y" if has_any_phone else "N"
             
             # Update engagement_score to max (best property)
-            base_row["engagement_score"] = str(max_engagement_score)
+            if engagement_score_idx is not None:
+                base_row[engagement_score_idx] = max_engagement_score_str
             
             # Update property_count field if it exists
-            if "property_count" in base_row:
-                base_row["property_count"] = str(property_count)
+            if property_count_idx is not None:
+                base_row[property_count_idx] = property_count_str
             
-            # Update why_flagged to reflect consolidation
-            why_flagged = base_row.get("why_flagged", "").strip()
-            if property_count > 1:
-                if why_flagged:
-                    base_row["why_flagged"] = f"{why_flagged} | {property_count} properties consolidated"
-                else:
-                    base_row["why_flagged"] = f"{property_count} properties consolidated"
+            for i, last_idx in repeated_columns:
+                base_row[i] = base_row[last_idx]
             
             writer.writerow(base_row)
             
             # Progress update
-            processed = counts["single_property"] + counts["multiple_properties"]
-            if len(entity_groups) > 1000 and processed % 1000 == 0:
+            if show_progress and processed % 1000 == 0:
                 print(f"Processed {processed:,} entities...")
     
     return counts
@@ -211,6 +474,21 @@ def group_entities_by_name(
 
 def main():
     """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description="Group investor entities by name"
+    )
+    
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes (0 = one per CPU, default: 1; "
+             "input with multi-line quoted fields always uses 1)"
+    )
+    
+    args = parser.parse_args()
+    workers = args.workers if args.workers > 0 else (os.cpu_count() or 1)
+    
     input_path = Path("output/note_broker_investor_priority.csv")
     output_path = Path("output/note_broker_investor_priority_grouped.csv")
     
@@ -230,9 +508,10 @@ def main():
     print()
     print(f"Input file: {input_path}")
     print(f"Output file: {output_path}")
+    print(f"Workers: {workers}")
     print()
     
-    counts = group_entities_by_name(input_path, output_path)
+    counts = group_entities_by_name(input_path, output_path, workers=workers)
     
     print()
     print("=" * 70)
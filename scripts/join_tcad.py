@@ -6,40 +6,144 @@ Enriches private note leads with TCAD property data when a parcel/account match
 
 import csv
 from pathlib import Path
-from typing import Dict, Optional
+from operator import itemgetter
+from typing import Dict, List, Optional, Set, Tuple
 
 
-def load_tcad_lookup(tcad_path: Path) -> Dict[str, Dict[str, str]]:
+# TCAD enrichment fields added to each lead, in output order. Each is filled
+# from the TCAD column of the same name without the "tcad_" prefix.
+TCAD_ENRICHMENT_FIELDS = [
+    "tcad_owner_name",
+    "tcad_situs_address",
+    "tcad_situs_city",
+    "tcad_situs_state",
+    "tcad_situs_zip",
+    "tcad_mailing_address",
+    "tcad_mailing_city",
+    "tcad_mailing_state",
+    "tcad_mailing_zip",
+    "tcad_property_type",
+    "tcad_land_value",
+    "tcad_improvement_value",
+    "tcad_total_value"
+]
+
+
+def find_account_id_column(columns: List[str], apn_field: str) -> Optional[int]:
+    """
+    Find the leads column holding the APN/account_id used to match TCAD data.
+    
+    Args:
+        columns: Header columns of the leads file
+        apn_field: Recorder column mapped to "apn" (may be blank)
+        
+    Returns:
+        Column index (the last occurrence of a repeated name, as
+        csv.DictReader read it), or None if the file has no APN column
+    """
+    column_index = {column: i for i, column in enumerate(columns)}
+    for field in (apn_field, "APN", "apn", "account_id"):
+        if field and field in column_index:
+            return column_index[field]
+    return None
+
+
+def collect_lead_account_ids(leads_path: Path, column_mapping: Dict[str, str]) -> Set[str]:
+    """
+    Collect the account IDs referenced by a leads file.
+    
+    Args:
+        leads_path: Path to private_note_leads.csv
+        column_mapping: Column mapping from recorder to canonical fields
+        
+    Returns:
+        Set of non-empty account IDs
+    """
+    account_ids = set()
+    
+    with open(leads_path, 'r', encoding='utf-8', errors='replace') as f:
+        reader = csv.reader(f)
+        columns = next(reader, [])
+        account_idx = find_account_id_column(columns, column_mapping.get("apn", ""))
+        if account_idx is None:
+            return account_ids
+        
+        for row in reader:
+            if len(row) > account_idx:
+                account_id = row[account_idx].strip()
+                if account_id:
+                    account_ids.add(account_id)
+    
+    return account_ids
+
+
+def load_tcad_lookup(tcad_path: Path, account_ids: Optional[Set[str]] = None) -> Dict[str, Tuple[str, ...]]:
     """
     Load TCAD data into a lookup dictionary keyed by account_id.
     
+    Only the columns used for enrichment are kept, as one tuple per account.
+    
     Args:
         tcad_path: Path to TCAD prop_clean.csv
+        account_ids: If given, only keep TCAD rows for these account IDs
+            (e.g. from collect_lead_account_ids), so memory scales with the
+            leads file instead of the full TCAD export
         
     Returns:
-        Dictionary mapping account_id -> TCAD row data
+        Dictionary mapping account_id -> TCAD values in TCAD_ENRICHMENT_FIELDS
+        order (blank for columns missing from the file)
     """
     tcad_lookup = {}
     
     if not tcad_path.exists():
         return tcad_lookup
     
+    # No lead references an account, so no TCAD row can match
+    if account_ids is not None and not account_ids:
+        return tcad_lookup
+    
     print(f"Loading TCAD data from {tcad_path}...")
     
     with open(tcad_path, 'r', encoding='utf-8', errors='replace') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            account_id = row.get("account_id", "").strip()
-            if account_id:
-                tcad_lookup[account_id] = row
+        reader = csv.reader(f)
+        columns = next(reader, [])
+        
+        # A repeated column name reads its last occurrence (as
+        # csv.DictReader did); missing columns point at a blank padding slot
+        # after the last column
+        width = len(columns)
+        column_index = {column: i for i, column in enumerate(columns)}
+        account_idx = column_index.get("account_id")
+        source_fields = [field[len("tcad_"):] for field in TCAD_ENRICHMENT_FIELDS]
+        get_values = itemgetter(*(column_index.get(field, width) for field in source_fields))
+        padding = [""] * (width + 1)
+        
+        # Without an account_id column no row has an account ID to match
+        rows = reader if account_idx is not None else ()
+        
+        for row in rows:
+            if len(row) <= account_idx:
+                continue  # Blank/short row
+            account_id = row[account_idx].strip()
+            if account_id and (account_ids is None or account_id in account_ids):
+                if len(row) <= width:
+                    row += padding[len(row):]
+                else:
+                    # Drop fields past the header (csv.DictReader kept them
+                    # under None) so the padding slot stays blank
+                    row[width:] = [""]
+                tcad_lookup[account_id] = get_values(row)
     
-    print(f"Loaded {len(tcad_lookup):,} TCAD records")
+    if account_ids is None:
+        print(f"Loaded {len(tcad_lookup):,} TCAD records")
+    else:
+        print(f"Loaded {len(tcad_lookup):,} TCAD records matching {len(account_ids):,} lead account IDs")
     return tcad_lookup
 
 
 def enrich_leads_with_tcad(
     leads_path: Path,
-    tcad_lookup: Dict[str, Dict[str, str]],
+    tcad_lookup: Dict[str, Tuple[str, ...]],
     column_mapping: Dict[str, str],
     output_path: Path
 ):
@@ -48,86 +152,62 @@ def enrich_leads_with_tcad(
     
     Args:
         leads_path: Path to private_note_leads.csv
-        tcad_lookup: TCAD lookup dictionary
+        tcad_lookup: TCAD lookup dictionary from load_tcad_lookup
         column_mapping: Column mapping from recorder to canonical fields
         output_path: Path for enriched output
     """
-    # TCAD enrichment fields to add
-    tcad_enrichment_fields = [
-        "tcad_owner_name",
-        "tcad_situs_address",
-        "tcad_situs_city",
-        "tcad_situs_state",
-        "tcad_situs_zip",
-        "tcad_mailing_address",
-        "tcad_mailing_city",
-        "tcad_mailing_state",
-        "tcad_mailing_zip",
-        "tcad_property_type",
-        "tcad_land_value",
-        "tcad_improvement_value",
-        "tcad_total_value"
-    ]
+    no_match = [""] * len(TCAD_ENRICHMENT_FIELDS)
     
     # Read leads file
     with open(leads_path, 'r', encoding='utf-8', errors='replace') as f:
-        reader = csv.DictReader(f)
-        original_columns = list(reader.fieldnames or [])
+        reader = csv.reader(f)
+        original_columns = next(reader, [])
+        width = len(original_columns)
+        
+        # Look for APN/account_id in recorder data
+        account_idx = find_account_id_column(original_columns, column_mapping.get("apn", ""))
         
         # Add TCAD enrichment columns
-        output_columns = original_columns + tcad_enrichment_fields
+        output_columns = original_columns + TCAD_ENRICHMENT_FIELDS
+        
+        # Repeated column names (e.g. a re-enriched file) repeat the value at
+        # the name's last position, as they did when rows were written by name
+        output_index = {column: i for i, column in enumerate(output_columns)}
+        repeated_columns = [
+            (i, output_index[column])
+            for i, column in enumerate(output_columns)
+            if output_index[column] != i
+        ]
         
         # Write enriched leads
         with open(output_path, 'w', newline='', encoding='utf-8') as out_f:
-            writer = csv.DictWriter(out_f, fieldnames=output_columns)
-            writer.writeheader()
+            writer = csv.writer(out_f)
+            writer.writerow(output_columns)
             
             matches = 0
             total = 0
             
             for row in reader:
+                if not row:
+                    continue  # Skip blank lines (as csv.DictReader does)
                 total += 1
-                enriched_row = dict(row)
+                if len(row) != width:
+                    row = (row + [""] * width)[:width]
                 
-                # Try to find matching TCAD record
-                # Look for APN/account_id in recorder data
-                apn_field = column_mapping.get("apn", "")
-                account_id = ""
-                
-                if apn_field and apn_field in row:
-                    account_id = row[apn_field].strip()
-                elif "APN" in row:
-                    account_id = row["APN"].strip()
-                elif "apn" in row:
-                    account_id = row["apn"].strip()
-                elif "account_id" in row:
-                    account_id = row["account_id"].strip()
+                account_id = row[account_idx].strip() if account_idx is not None else ""
                 
                 # Match with TCAD data
-                if account_id and account_id in tcad_lookup:
-                    tcad_row = tcad_lookup[account_id]
-                    enriched_row["tcad_owner_name"] = tcad_row.get("owner_name", "")
-                    enriched_row["tcad_situs_address"] = tcad_row.get("situs_address", "")
-                    enriched_row["tcad_situs_city"] = tcad_row.get("situs_city", "")
-                    enriched_row["tcad_situs_state"] = tcad_row.get("situs_state", "")
-                    enriched_row["tcad_situs_zip"] = tcad_row.get("situs_zip", "")
-                    enriched_row["tcad_mailing_address"] = tcad_row.get("mailing_address", "")
-                    enriched_row["tcad_mailing_city"] = tcad_row.get("mailing_city", "")
-                    enriched_row["tcad_mailing_state"] = tcad_row.get("mailing_state", "")
-                    enriched_row["tcad_mailing_zip"] = tcad_row.get("mailing_zip", "")
-                    enriched_row["tcad_property_type"] = tcad_row.get("property_type", "")
-                    enriched_row["tcad_land_value"] = tcad_row.get("land_value", "")
-                    enriched_row["tcad_improvement_value"] = tcad_row.get("improvement_value", "")
-                    enriched_row["tcad_total_value"] = tcad_row.get("total_value", "")
+                tcad_values = tcad_lookup.get(account_id) if account_id else None
+                if tcad_values is not None:
+                    row.extend(tcad_values)
                     matches += 1
                 else:
                     # Fill with empty strings if no match
-                    for field in tcad_enrichment_fields:
-                        enriched_row[field] = ""
+                    row.extend(no_match)
+                
+                for i, last_idx in repeated_columns:
+                    row[i] = row[last_idx]
                 
-                writer.writerow(enriched_row)
+                writer.writerow(row)
             
             print(f"Enriched {matches:,} of {total:,} leads with TCAD data ({matches/total*100 if total > 0 else 0:.1f}% match rate)")
-
-
-
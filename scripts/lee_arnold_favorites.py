@@ -19,10 +19,19 @@ Usage:
 import argparse
 import csv
 import hashlib
+import os
+import re
+import shutil
 import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, Optional, Tuple, Set
-from collections import Counter, defaultdict
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, TextIO, Tuple, Set
+from collections import Counter
+
+from generate_property_targets import find_chunk_offsets, has_multiline_fields, iter_lines
 
 
 # ============================================================================
@@ -71,6 +80,29 @@ INSTITUTIONAL_KEYWORDS = [
     "MERRILL LYNCH", "FIDELITY", "VANGUARD"
 ]
 
+# All institutional keywords as one alternation, so a name is scanned once
+# instead of once per keyword (plain substring matches, like `keyword in name`)
+INSTITUTIONAL_PATTERN = re.compile("|".join(map(re.escape, INSTITUTIONAL_KEYWORDS)))
+
+# Complex owner name patterns (exclude, #8)
+COMPLEX_OWNER_KEYWORDS = [
+    "TRUST DATED",
+    "REVOCABLE TRUST",
+    "IRREVOCABLE TRUST",
+    "FAMILY TRUST DATED",
+    "ESTATE OF",
+    "HEIRS OF",
+    "UNKNOWN",
+    "ET AL",
+    "ETAL",
+    "ETC",
+    "ETC.",
+    "ET CETERA"
+]
+
+# Complex owner keywords as one alternation (plain substring matches)
+COMPLEX_OWNER_PATTERN = re.compile("|".join(map(re.escape, COMPLEX_OWNER_KEYWORDS)))
+
 # Property type codes for residential (single family, duplex, triplex, quadplex)
 # R = Residential (general)
 # Need to check actual codes, but typically:
@@ -78,21 +110,64 @@ INSTITUTIONAL_KEYWORDS = [
 # R4, R5 = Duplex/Triplex/Quadplex
 RESIDENTIAL_PROPERTY_TYPES = ["R", "R1", "R2", "R3", "R4", "R5"]
 
+# Characters removed from amount strings before parsing ("$1,234" -> "1234")
+AMOUNT_STRIP_TABLE = str.maketrans("", "", "$, ")
+
+# Output CSV columns (same for targets, review and discarded files)
+OUTPUT_COLUMNS = [
+    "lead_id", "full_name", "company_name", "owner_type",
+    "mailing_address", "mailing_city", "mailing_state", "mailing_zip",
+    "situs_address", "situs_city", "situs_state", "situs_zip",
+    "tcad_account_id", "owner_occupied_guess", "total_value",
+    "property_type", "property_count", "lead_score", "why_flagged",
+    "data_limitations"
+]
+
+# Output file keys (targets, review and discarded files)
+OUTPUT_NAMES = ["targets", "review", "discarded"]
+
+# Notes about criteria that cannot be checked from TCAD data
+DATA_LIMITATIONS = " | ".join([
+    "SQ_FT_REVIEW",  # Square footage not in data
+    "BED_BATH_REVIEW"  # Bedrooms/bathrooms not in data
+])
+
+
+class TCADRow(NamedTuple):
+    """Stripped prop_clean.csv fields used to classify a property."""
+    account_id: str
+    owner_name: str
+    mailing_address: str
+    mailing_city: str
+    mailing_state: str
+    mailing_zip: str
+    situs_address: str
+    situs_city: str
+    situs_state: str
+    situs_zip: str
+    property_type: str
+    land_value: str
+    improvement_value: str
+    total_value: str
+
 
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
 
 def parse_amount(amount_str: str) -> Optional[float]:
-    """Parse amount from string."""
-    if not amount_str or not amount_str.strip():
+    """Parse amount from string (plain numbers skip the "$1,234" cleanup)."""
+    if not amount_str:
         return None
     
-    cleaned = amount_str.strip().replace("$", "").replace(",", "").replace(" ", "")
+    try:
+        return float(amount_str)
+    except ValueError:
+        pass
     
     try:
-        return float(cleaned)
-    except (ValueError, AttributeError):
+        return float(amount_str.translate(AMOUNT_STRIP_TABLE))
+    except ValueError:
         return None
 
 
@@ -101,8 +176,7 @@ def is_institutional_owner(owner_name: str) -> bool:
     if not owner_name:
         return False
     
-    owner_upper = owner_name.upper()
-    return any(keyword in owner_upper for keyword in INSTITUTIONAL_KEYWORDS)
+    return INSTITUTIONAL_PATTERN.search(owner_name.upper()) is not None
 
 
 def is_complex_owner_name(owner_name: str) -> bool:
@@ -121,42 +195,22 @@ def is_complex_owner_name(owner_name: str) -> bool:
     if len(owner_name) > 80:
         return True
     
-    name_upper = owner_name.upper()
-    
-    # Complex trust patterns
-    complex_patterns = [
-        "TRUST DATED",
-        "REVOCABLE TRUST",
-        "IRREVOCABLE TRUST",
-        "FAMILY TRUST DATED",
-        "ESTATE OF",
-        "HEIRS OF",
-        "UNKNOWN",
-        "ET AL",
-        "ETAL",
-        "ETC",
-        "ETC.",
-        "ET CETERA"
-    ]
-    
-    if any(pattern in name_upper for pattern in complex_patterns):
-        return True
-    
     # Multiple commas or special characters suggest complexity
     if owner_name.count(",") > 2:
         return True
     
-    return False
+    # Complex trust patterns
+    return COMPLEX_OWNER_PATTERN.search(owner_name.upper()) is not None
 
 
-def is_vacant_land(row: Dict[str, str]) -> bool:
+def is_vacant_land(row: TCADRow) -> bool:
     """
     Check if property is vacant land (#2 - exclude).
     
     Vacant land indicators:
     - Zero or very low improvement value
     """
-    improvement_value = parse_amount(row.get("improvement_value", ""))
+    improvement_value = parse_amount(row.improvement_value)
     
     if improvement_value is None or improvement_value == 0:
         return True
@@ -168,8 +222,14 @@ def is_vacant_land(row: Dict[str, str]) -> bool:
     return False
 
 
+@lru_cache(maxsize=None)
 def is_residential_property(property_type: str) -> bool:
-    """Check if property type is residential (single family, duplex, triplex, quadplex)."""
+    """
+    Check if property type is residential (single family, duplex, triplex, quadplex).
+    
+    A county file only has a handful of distinct property type codes, so
+    results are cached per code instead of re-checked for every row.
+    """
     if not property_type:
         return False
     
@@ -281,10 +341,10 @@ def normalize_address(address: str) -> str:
     return normalized
 
 
-def is_absentee_owner(row: Dict[str, str]) -> bool:
+def is_absentee_owner(row: TCADRow) -> bool:
     """Check if owner is absentee (mailing address != situs address)."""
-    mailing = normalize_address(row.get("mailing_address", ""))
-    situs = normalize_address(row.get("situs_address", ""))
+    mailing = normalize_address(row.mailing_address)
+    situs = normalize_address(row.situs_address)
     
     if not mailing or not situs:
         return False
@@ -293,50 +353,51 @@ def is_absentee_owner(row: Dict[str, str]) -> bool:
 
 
 def classify_property_row(
-    row: Dict[str, str],
+    row: TCADRow,
     fha_cap: float,
     property_count: int
-) -> Tuple[str, str, int, str]:
+) -> Tuple[str, str, int, str, Optional[bool]]:
     """
     Classify a property row for Lee Arnold Favorites.
     
     Returns:
-        Tuple of (classification, owner_type, lead_score, why_flagged)
+        Tuple of (classification, owner_type, lead_score, why_flagged, is_absentee).
+        is_absentee is None if classification stopped before checking it.
     """
-    owner_name = row.get("owner_name", "").strip()
-    property_type = row.get("property_type", "").strip()
+    owner_name = row.owner_name
+    property_type = row.property_type
     
     # Hard-exclude institutional owners
     if is_institutional_owner(owner_name):
-        return ("DISCARD", "INSTITUTIONAL", 0, "Institutional/bank owner")
+        return ("DISCARD", "INSTITUTIONAL", 0, "Institutional/bank owner", None)
     
     # Exclude complex owner names (#8)
     if is_complex_owner_name(owner_name):
-        return ("DISCARD", "COMPLEX", 0, "Complex owner name")
+        return ("DISCARD", "COMPLEX", 0, "Complex owner name", None)
     
     # Exclude vacant land (#2)
     if is_vacant_land(row):
-        return ("DISCARD", "VACANT", 0, "Vacant land or minimal improvement")
+        return ("DISCARD", "VACANT", 0, "Vacant land or minimal improvement", None)
     
     # Must be residential property type
     if not is_residential_property(property_type):
-        return ("DISCARD", "NON_RESIDENTIAL", 0, f"Non-residential property type: {property_type}")
+        return ("DISCARD", "NON_RESIDENTIAL", 0, f"Non-residential property type: {property_type}", None)
     
     # Check property value (FHA cap)
-    total_value = parse_amount(row.get("total_value", ""))
+    total_value = parse_amount(row.total_value)
     
     if total_value is None or total_value <= 0:
-        return ("REVIEW", "UNKNOWN", 0, "Missing or invalid total_value")
+        return ("REVIEW", "UNKNOWN", 0, "Missing or invalid total_value", None)
     
     if total_value > fha_cap * 1.1:  # Allow 10% buffer for review
-        return ("REVIEW", "VALUE", 0, f"Value exceeds FHA cap ({total_value:,.0f} > {fha_cap:,.0f})")
+        return ("REVIEW", "VALUE", 0, f"Value exceeds FHA cap ({total_value:,.0f} > {fha_cap:,.0f})", None)
     
     # Check land value (estimate lot size)
-    land_value = parse_amount(row.get("land_value", ""))
+    land_value = parse_amount(row.land_value)
     if land_value and land_value > MAX_LAND_VALUE_FOR_HALF_ACRE:
         estimated_acres = estimate_lot_size_from_land_value(land_value)
         if estimated_acres and estimated_acres > 0.6:  # Slightly over 0.5 for buffer
-            return ("REVIEW", "LOT_SIZE", 0, f"Lot size may exceed 0.5 acres (estimated {estimated_acres:.2f} acres)")
+            return ("REVIEW", "LOT_SIZE", 0, f"Lot size may exceed 0.5 acres (estimated {estimated_acres:.2f} acres)", None)
     
     # Calculate lead score
     is_absentee = is_absentee_owner(row)
@@ -345,127 +406,293 @@ def classify_property_row(
     )
     
     # Determine owner type
+    owner_upper = owner_name.upper()
     owner_type = "PERSON"
-    if "LLC" in owner_name.upper():
+    if "LLC" in owner_upper:
         owner_type = "LLC"
-    elif "TRUST" in owner_name.upper():
+    elif "TRUST" in owner_upper:
         owner_type = "TRUST"
     
     # All checks passed - this is a TARGET
-    return ("TARGET", owner_type, lead_score, why_flagged)
+    return ("TARGET", owner_type, lead_score, why_flagged, is_absentee)
 
 
-def build_target_row(row: Dict[str, str], owner_type: str, lead_score: int, why_flagged: str, property_count: int) -> Dict[str, str]:
-    """Build output row for target."""
-    owner_name = row.get("owner_name", "").strip()
-    account_id = row.get("account_id", "").strip()
-    mailing_zip = row.get("mailing_zip", "").strip()
+def build_target_row(
+    row: TCADRow,
+    owner_type: str,
+    lead_score: int,
+    why_flagged: str,
+    property_count: int,
+    is_absentee: Optional[bool] = None
+) -> List[str]:
+    """
+    Build output row for target (values in OUTPUT_COLUMNS order).
+    
+    is_absentee is taken from classify_property_row when it was computed
+    there, and only recomputed otherwise.
+    """
+    owner_name = row.owner_name
+    account_id = row.account_id
+    mailing_zip = row.mailing_zip
     
     lead_id = generate_lead_id(owner_name, account_id, mailing_zip)
     
     full_name = owner_name if owner_type == "PERSON" else ""
     company_name = owner_name if owner_type in ["LLC", "TRUST"] else ""
     
-    is_absentee = is_absentee_owner(row)
+    if is_absentee is None:
+        is_absentee = is_absentee_owner(row)
     owner_occupied_guess = "N" if is_absentee else "Y"
     
-    # Add notes about missing data
-    notes = []
-    notes.append("SQ_FT_REVIEW")  # Square footage not in data
-    notes.append("BED_BATH_REVIEW")  # Bedrooms/bathrooms not in data
-    
-    output_row = {
-        "lead_id": lead_id,
-        "full_name": full_name,
-        "company_name": company_name,
-        "owner_type": owner_type,
-        "mailing_address": row.get("mailing_address", "").strip(),
-        "mailing_city": row.get("mailing_city", "").strip(),
-        "mailing_state": row.get("mailing_state", "").strip(),
-        "mailing_zip": mailing_zip,
-        "situs_address": row.get("situs_address", "").strip(),
-        "situs_city": row.get("situs_city", "").strip(),
-        "situs_state": row.get("situs_state", "").strip(),
-        "situs_zip": row.get("situs_zip", "").strip(),
-        "tcad_account_id": account_id,
-        "owner_occupied_guess": owner_occupied_guess,
-        "total_value": row.get("total_value", "").strip(),
-        "property_type": row.get("property_type", "").strip(),
-        "property_count": str(property_count),  # Highlight multiple property owners
-        "lead_score": str(lead_score),
-        "why_flagged": why_flagged,
-        "data_limitations": " | ".join(notes)  # Note what data is missing
-    }
+    return [
+        lead_id,
+        full_name,
+        company_name,
+        owner_type,
+        row.mailing_address,
+        row.mailing_city,
+        row.mailing_state,
+        mailing_zip,
+        row.situs_address,
+        row.situs_city,
+        row.situs_state,
+        row.situs_zip,
+        account_id,
+        owner_occupied_guess,
+        row.total_value,
+        row.property_type,
+        str(property_count),  # Highlight multiple property owners
+        str(lead_score),
+        why_flagged,
+        DATA_LIMITATIONS  # Note what data is missing
+    ]
+
+
+def read_tcad_rows(reader: Iterable[List[str]], fieldnames: List[str]) -> Iterator[TCADRow]:
+    """
+    Convert csv.reader rows into TCADRow records.
+    
+    Column positions are resolved once from the header; a repeated column
+    name reads its last occurrence (as csv.DictReader did). Columns missing
+    from the file (or from a short row) are read as blank. Values are stripped
+    here once, so the classifier and row builders use them as-is.
     
-    return output_row
+    Args:
+        reader: csv.reader over the data rows (header already consumed)
+        fieldnames: Header columns of the TCAD file
+        
+    Yields:
+        TCADRow with stripped values for each non-blank row
+    """
+    # Missing columns point at a blank slot after the last header column
+    column_index = {column: i for i, column in enumerate(fieldnames)}
+    blank_index = len(fieldnames)
+    indices = [column_index.get(field, blank_index) for field in TCADRow._fields]
+    width = max(indices) + 1
+    get_fields = itemgetter(*indices)
+    make_row = TCADRow._make
+    
+    for row in reader:
+        if not row:
+            continue  # Skip blank lines (as csv.DictReader does)
+        if len(row) < width:
+            row += [""] * (width - len(row))
+        elif width > blank_index:
+            # Drop fields past the header (csv.DictReader kept them under
+            # None) so the blank slot for missing columns stays blank
+            row[blank_index:] = [""]
+        yield make_row(map(str.strip, get_fields(row)))
 
 
 def count_properties_per_owner(tcad_path: Path) -> Dict[str, int]:
     """
     First pass: Count properties per owner to highlight multiple property owners (#5).
     
+    Only the owner_name column is read, and the counting loop runs inside
+    Counter, so this pass costs little next to the classification pass.
+    
     Returns:
         Dictionary mapping normalized owner name -> property count
     """
     print("Counting properties per owner...")
-    owner_counts = defaultdict(int)
     
     with open(tcad_path, 'r', encoding='utf-8', errors='replace') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            owner_name = row.get("owner_name", "").strip().upper()
-            if owner_name:
-                owner_counts[owner_name] += 1
+        reader = csv.reader(f)
+        header = next(reader, [])
+        if "owner_name" in header:
+            # Last occurrence of a repeated name, as csv.DictReader read it
+            owner_idx = len(header) - 1 - header[::-1].index("owner_name")
+            owner_counts = Counter(
+                row[owner_idx].strip().upper() for row in reader if len(row) > owner_idx
+            )
+        else:
+            owner_counts = Counter()
+    
+    # Rows without an owner name are not counted
+    owner_counts.pop("", None)
     
     print(f"Found {len(owner_counts):,} unique owners")
     return owner_counts
 
 
+def make_row_writer(file: TextIO) -> Callable[[List[str]], None]:
+    """
+    Return a function that writes one CSV row to file.
+    
+    Rows with no field that needs quoting (no commas, quotes or line breaks)
+    are joined and written directly, which skips csv.writer's per-field
+    quoting checks. Any other row goes through csv.writer. Both paths write
+    the same bytes as csv.writer(file).writerow.
+    
+    Args:
+        file: Output file opened with newline=''
+        
+    Returns:
+        Function taking a list of string values
+    """
+    writerow = csv.writer(file).writerow
+    write = file.write
+    
+    def write_row(row: List[str]) -> None:
+        line = ",".join(row)
+        if line.count(",") != len(row) - 1 or '"' in line or "\n" in line or "\r" in line:
+            writerow(row)
+        else:
+            write(line + "\r\n")
+    
+    return write_row
+
+
+def classify_rows(
+    rows: Iterable[TCADRow],
+    writers: Dict,
+    owner_counts: Dict[str, int],
+    fha_cap: float,
+    show_progress: bool = True
+) -> Tuple[Dict[str, int], Counter]:
+    """
+    Classify property rows and write each to the matching output writer.
+    
+    Args:
+        rows: Property rows
+        writers: Row writers (from make_row_writer) keyed by "targets", "review", and "discarded"
+        owner_counts: Property count per normalized owner name
+        fha_cap: FHA loan limit cap
+        show_progress: Print a progress line every 100,000 rows
+        
+    Returns:
+        Tuple of (counts, owner_type_counter)
+    """
+    counts = {"targets": 0, "review": 0, "discarded": 0}
+    owner_type_counter = Counter()
+    
+    # Writer and count key for each classification
+    outputs = {
+        "TARGET": (writers["targets"], "targets"),
+        "REVIEW": (writers["review"], "review"),
+        "DISCARD": (writers["discarded"], "discarded"),
+    }
+    
+    for row_num, row in enumerate(rows, start=2):
+        owner_name = row.owner_name.upper()
+        property_count = owner_counts.get(owner_name, 1)
+        
+        # Classify row
+        classification, owner_type, lead_score, why_flagged, is_absentee = classify_property_row(
+            row, fha_cap, property_count
+        )
+        
+        owner_type_counter[owner_type] += 1
+        
+        # Build output row
+        output_row = build_target_row(row, owner_type, lead_score, why_flagged, property_count, is_absentee)
+        
+        write_row, count_key = outputs[classification]
+        write_row(output_row)
+        counts[count_key] += 1
+        
+        # Progress update
+        if show_progress and row_num % 100000 == 0:
+            print(f"Processed {row_num:,} rows... (targets: {counts['targets']:,}, "
+                  f"review: {counts['review']:,}, discarded: {counts['discarded']:,})")
+    
+    return counts, owner_type_counter
+
+
+def process_chunk(
+    tcad_path: Path,
+    start: int,
+    end: int,
+    fieldnames: List[str],
+    chunk_dir: Path,
+    owner_counts: Dict[str, int],
+    fha_cap: float
+) -> Tuple[Dict[str, Path], Dict[str, int], Counter]:
+    """
+    Worker: classify the rows in one byte range of the TCAD file.
+    
+    Partial outputs are written without headers so they can be concatenated
+    in chunk order.
+    
+    Args:
+        tcad_path: Path to prop_clean.csv
+        start: Byte offset of the first line in the chunk
+        end: Byte offset just past the last line in the chunk
+        fieldnames: Header columns of the TCAD file
+        chunk_dir: Directory for this chunk's partial output files
+        owner_counts: Property count per normalized owner name (whole file)
+        fha_cap: FHA loan limit cap
+        
+    Returns:
+        Tuple of (partial file paths keyed by output name, counts, owner_type_counter)
+    """
+    chunk_dir.mkdir(parents=True, exist_ok=True)
+    paths = {name: chunk_dir / f"{name}.csv" for name in OUTPUT_NAMES}
+    
+    files = {name: open(path, 'w', newline='', encoding='utf-8') for name, path in paths.items()}
+    try:
+        writers = {name: make_row_writer(file) for name, file in files.items()}
+        rows = read_tcad_rows(csv.reader(iter_lines(tcad_path, start, end)), fieldnames)
+        counts, owner_type_counter = classify_rows(
+            rows, writers, owner_counts, fha_cap, show_progress=False
+        )
+    finally:
+        for file in files.values():
+            file.close()
+    
+    return paths, counts, owner_type_counter
+
+
 def process_tcad_file(
     tcad_path: Path,
     output_dir: Path,
-    fha_cap: float
+    fha_cap: float,
+    workers: int = 1
 ) -> Dict[str, int]:
     """
     Process TCAD file and generate Lee Arnold Favorites.
+    
+    Args:
+        tcad_path: Path to prop_clean.csv
+        output_dir: Output directory
+        fha_cap: FHA loan limit cap
+        workers: Number of worker processes (rows are split into one chunk per worker)
+        
+    Returns:
+        Tuple of (counts, owner_type_counter)
     """
     output_dir.mkdir(parents=True, exist_ok=True)
     
-    targets_path = output_dir / "lee_arnold_favorites.csv"
-    review_path = output_dir / "lee_arnold_favorites_review.csv"
-    discard_path = output_dir / "lee_arnold_favorites_discarded.csv"
+    paths = {
+        "targets": output_dir / "lee_arnold_favorites.csv",
+        "review": output_dir / "lee_arnold_favorites_review.csv",
+        "discarded": output_dir / "lee_arnold_favorites_discarded.csv",
+    }
     
     # First pass: Count properties per owner
     owner_counts = count_properties_per_owner(tcad_path)
     print()
     
-    # Define output columns
-    output_columns = [
-        "lead_id", "full_name", "company_name", "owner_type",
-        "mailing_address", "mailing_city", "mailing_state", "mailing_zip",
-        "situs_address", "situs_city", "situs_state", "situs_zip",
-        "tcad_account_id", "owner_occupied_guess", "total_value",
-        "property_type", "property_count", "lead_score", "why_flagged",
-        "data_limitations"
-    ]
-    
-    # Open output files
-    targets_file = open(targets_path, 'w', newline='', encoding='utf-8')
-    review_file = open(review_path, 'w', newline='', encoding='utf-8')
-    discard_file = open(discard_path, 'w', newline='', encoding='utf-8')
-    
-    targets_writer = csv.DictWriter(targets_file, fieldnames=output_columns)
-    review_writer = csv.DictWriter(review_file, fieldnames=output_columns)
-    discard_writer = csv.DictWriter(discard_file, fieldnames=output_columns)
-    
-    targets_writer.writeheader()
-    review_writer.writeheader()
-    discard_writer.writeheader()
-    
-    # Process rows
-    counts = {"targets": 0, "review": 0, "discarded": 0}
-    owner_type_counter = Counter()
-    
     print(f"Processing {tcad_path}...")
     print(f"FHA Cap: ${fha_cap:,.0f}")
     print(f"Max SQ FT: {MAX_SQ_FT} (NOTE: Not in data, requires manual review)")
@@ -473,42 +700,61 @@ def process_tcad_file(
     print(f"Max Bathrooms: {MAX_BATHROOMS} (NOTE: Not in data, requires manual review)")
     print()
     
-    with open(tcad_path, 'r', encoding='utf-8', errors='replace') as f:
-        reader = csv.DictReader(f)
+    # Chunks split at raw newlines would cut multi-line quoted fields apart
+    if workers > 1 and has_multiline_fields(tcad_path):
+        print("Quoted fields span multiple lines; using 1 worker")
+        print()
+        workers = 1
+    
+    # Open output files
+    files = {name: open(path, 'w', newline='', encoding='utf-8') for name, path in paths.items()}
+    
+    try:
+        writers = {name: make_row_writer(file) for name, file in files.items()}
+        for write_row in writers.values():
+            write_row(OUTPUT_COLUMNS)
         
-        for row_num, row in enumerate(reader, start=2):
-            owner_name = row.get("owner_name", "").strip().upper()
-            property_count = owner_counts.get(owner_name, 1)
-            
-            # Classify row
-            classification, owner_type, lead_score, why_flagged = classify_property_row(
-                row, fha_cap, property_count
-            )
-            
-            owner_type_counter[owner_type] += 1
-            
-            # Build output row
-            target_row = build_target_row(row, owner_type, lead_score, why_flagged, property_count)
+        if workers <= 1:
+            with open(tcad_path, 'r', encoding='utf-8', errors='replace') as f:
+                reader = csv.reader(f)
+                fieldnames = next(reader, [])
+                rows = read_tcad_rows(reader, fieldnames)
+                counts, owner_type_counter = classify_rows(rows, writers, owner_counts, fha_cap)
+        else:
+            # Split rows into line-aligned byte ranges and classify them in parallel
+            with open(tcad_path, 'r', encoding='utf-8', errors='replace', newline='') as f:
+                fieldnames = next(csv.reader(f), [])
+            offsets = find_chunk_offsets(tcad_path, workers)
             
-            if classification == "TARGET":
-                targets_writer.writerow(target_row)
-                counts["targets"] += 1
-            elif classification == "REVIEW":
-                review_writer.writerow(target_row)
-                counts["review"] += 1
-            else:  # DISCARD
-                discard_writer.writerow(target_row)
-                counts["discarded"] += 1
+            counts = {"targets": 0, "review": 0, "discarded": 0}
+            owner_type_counter = Counter()
             
-            # Progress update
-            if row_num % 100000 == 0:
-                print(f"Processed {row_num:,} rows... (targets: {counts['targets']:,}, "
-                      f"review: {counts['review']:,}, discarded: {counts['discarded']:,})")
-    
-    # Close files
-    targets_file.close()
-    review_file.close()
-    discard_file.close()
+            with tempfile.TemporaryDirectory(dir=output_dir) as tmp_dir:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    futures = [
+                        executor.submit(
+                            process_chunk, tcad_path, start, end, fieldnames,
+                            Path(tmp_dir) / f"chunk_{i}", owner_counts, fha_cap
+                        )
+                        for i, (start, end) in enumerate(zip(offsets, offsets[1:]))
+                    ]
+                    
+                    # Concatenate partial outputs in chunk order
+                    for i, future in enumerate(futures, start=1):
+                        chunk_paths, chunk_counts, chunk_owner_types = future.result()
+                        for name, chunk_path in chunk_paths.items():
+                            files[name].flush()
+                            with open(chunk_path, 'r', newline='', encoding='utf-8') as chunk_file:
+                                shutil.copyfileobj(chunk_file, files[name])
+                        for key, value in chunk_counts.items():
+                            counts[key] += value
+                        owner_type_counter.update(chunk_owner_types)
+                        print(f"Finished chunk {i}/{len(futures)} (targets: {counts['targets']:,}, "
+                              f"review: {counts['review']:,}, discarded: {counts['discarded']:,})")
+    finally:
+        # Close files
+        for file in files.values():
+            file.close()
     
     return counts, owner_type_counter
 
@@ -541,6 +787,14 @@ def main():
         help=f"FHA loan limit cap (default: {DEFAULT_FHA_CAP:,.0f} for Travis County, TX)"
     )
     
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes (0 = one per CPU, default: 1; "
+             "input with multi-line quoted fields always uses 1)"
+    )
+    
     args = parser.parse_args()
     
     tcad_path = Path(args.tcad)
@@ -549,6 +803,7 @@ def main():
         sys.exit(1)
     
     output_dir = Path(args.outdir)
+    workers = args.workers if args.workers > 0 else (os.cpu_count() or 1)
     
     print("=" * 70)
     print("LEE ARNOLD FAVORITES FILTER")
@@ -567,12 +822,14 @@ def main():
     print()
     print(f"TCAD file: {tcad_path}")
     print(f"Output directory: {output_dir}")
+    print(f"Workers: {workers}")
     print()
     
     counts, owner_type_counter = process_tcad_file(
         tcad_path=tcad_path,
         output_dir=output_dir,
-        fha_cap=args.fha_cap
+        fha_cap=args.fha_cap,
+        workers=workers
     )
     
     print()
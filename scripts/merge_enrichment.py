@@ -10,16 +10,20 @@ Usage:
 import argparse
 import csv
 import sys
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
 
-def load_enrichment_results(enrichment_path: Path) -> Dict[str, Dict[str, str]]:
+def load_enrichment_results(enrichment_path: Path) -> Dict[str, Tuple[str, str]]:
     """
     Load enrichment results into a dictionary keyed by lead_id.
     
+    Only the email and phone columns are kept, already stripped, instead of
+    the whole enrichment row.
+    
     Returns:
-        Dictionary mapping lead_id -> enrichment data
+        Dictionary mapping lead_id -> (email, phone)
     """
     enrichment_lookup = {}
     
@@ -30,12 +34,30 @@ def load_enrichment_results(enrichment_path: Path) -> Dict[str, Dict[str, str]]:
     print(f"Loading enrichment results from {enrichment_path}...")
     
     with open(enrichment_path, 'r', encoding='utf-8', errors='replace') as f:
-        reader = csv.DictReader(f)
+        reader = csv.reader(f)
+        header = next(reader, [])
+        
+        # A repeated column name reads its last occurrence (as
+        # csv.DictReader did); missing columns (and short rows) read as
+        # blank from the padding at index width
+        width = len(header)
+        column_index = {column: i for i, column in enumerate(header)}
+        get_fields = itemgetter(*[
+            column_index.get(field, width)
+            for field in ("lead_id", "email", "phone")
+        ])
         
         for row in reader:
-            lead_id = row.get("lead_id", "").strip()
+            if len(row) <= width:
+                row += [""] * (width + 1 - len(row))
+            else:
+                # Drop fields past the header (csv.DictReader kept them
+                # under None) so the padding slot stays blank
+                row[width:] = [""]
+            lead_id, email, phone = get_fields(row)
+            lead_id = lead_id.strip()
             if lead_id:
-                enrichment_lookup[lead_id] = row
+                enrichment_lookup[lead_id] = (email.strip(), phone.strip())
     
     print(f"Loaded {len(enrichment_lookup):,} enrichment records")
     return enrichment_lookup
@@ -59,8 +81,7 @@ def merge_enrichment(
     
     # Read leads file to get columns
     with open(leads_path, 'r', encoding='utf-8', errors='replace') as f:
-        reader = csv.DictReader(f)
-        lead_columns = list(reader.fieldnames or [])
+        lead_columns = next(csv.reader(f), [])
     
     # Add enrichment columns if not present
     enrichment_columns = ["email", "phone"]
@@ -70,6 +91,23 @@ def merge_enrichment(
         if col not in output_columns:
             output_columns.append(col)
     
+    # Column positions in the output row (rows are padded to output width).
+    # A repeated column name uses its last occurrence, as csv.DictReader did.
+    lead_width = len(lead_columns)
+    added_columns = [""] * (len(output_columns) - lead_width)
+    output_index = {column: i for i, column in enumerate(output_columns)}
+    lead_id_idx = output_index.get("lead_id")
+    email_idx = output_index["email"]
+    phone_idx = output_index["phone"]
+    
+    # Repeated column names repeat the value at the name's last position,
+    # as they did when rows were written by name
+    repeated_columns = [
+        (i, output_index[column])
+        for i, column in enumerate(output_columns)
+        if output_index[column] != i
+    ]
+    
     counts = {
         "total_rows": 0,
         "matched": 0,
@@ -85,47 +123,43 @@ def merge_enrichment(
     with open(leads_path, 'r', encoding='utf-8', errors='replace') as infile, \
          open(output_path, 'w', newline='', encoding='utf-8') as outfile:
         
-        reader = csv.DictReader(infile)
-        writer = csv.DictWriter(outfile, fieldnames=output_columns)
-        writer.writeheader()
+        reader = csv.reader(infile)
+        next(reader, None)
+        writer = csv.writer(outfile)
+        writer.writerow(output_columns)
         
         for row in reader:
+            if not row:
+                continue  # Skip blank lines (as csv.DictReader does)
             counts["total_rows"] += 1
             
-            lead_id = row.get("lead_id", "").strip()
+            # Create output row: lead columns (padded or cut to header width) + new columns
+            if len(row) != lead_width:
+                row = row[:lead_width] + [""] * (lead_width - len(row))
+            row += added_columns
             
-            # Create output row
-            output_row = dict(row)
+            lead_id = row[lead_id_idx].strip() if lead_id_idx is not None else ""
+            enrichment = enrichment_lookup.get(lead_id)
             
             # Merge enrichment data if available
-            if lead_id in enrichment_lookup:
-                enrichment_row = enrichment_lookup[lead_id]
+            if enrichment is not None:
+                email, phone = enrichment
                 counts["matched"] += 1
                 
-                # Add email if present
-                email = enrichment_row.get("email", "").strip()
+                # Add email/phone if present (otherwise keep the lead's value)
                 if email:
-                    output_row["email"] = email
+                    row[email_idx] = email
                     counts["with_email"] += 1
-                elif "email" not in output_row:
-                    output_row["email"] = ""
-                
-                # Add phone if present
-                phone = enrichment_row.get("phone", "").strip()
                 if phone:
-                    output_row["phone"] = phone
+                    row[phone_idx] = phone
                     counts["with_phone"] += 1
-                elif "phone" not in output_row:
-                    output_row["phone"] = ""
             else:
                 counts["unmatched"] += 1
-                # Add empty enrichment columns if not present
-                if "email" not in output_row:
-                    output_row["email"] = ""
-                if "phone" not in output_row:
-                    output_row["phone"] = ""
             
-            writer.writerow(output_row)
+            for i, last_idx in repeated_columns:
+                row[i] = row[last_idx]
+            
+            writer.writerow(row)
             
             # Progress update
             if counts["total_rows"] % 10000 == 0:
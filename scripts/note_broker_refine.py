@@ -16,9 +16,11 @@ Usage:
 
 import argparse
 import csv
+import re
 import sys
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Dict, NamedTuple, Optional, Tuple
 from collections import Counter
 
 
@@ -47,36 +49,89 @@ WEIGHT_MULTIPLE_PROPERTIES = 15
 WEIGHT_NOTE_SWEET_SPOT = 20
 WEIGHT_SIMPLE_NAME = 10
 
+# Mailing address markers for PO boxes and suites (not a street address)
+PO_BOX_INDICATORS = ["PO BOX", "P.O. BOX", "P O BOX", "POBOX", "BOX ", "PMB", "SUITE"]
+
+# PO box markers as one alternation, so an address is scanned once
+# instead of once per marker (plain substring matches, like `marker in address`)
+PO_BOX_PATTERN = re.compile("|".join(map(re.escape, PO_BOX_INDICATORS)))
+
+# Owner name patterns that make an owner harder to contact
+COMPLEX_NAME_PATTERNS = ["TRUST", "ESTATE", "HEIRS", "ET AL", "ETC", "UNKNOWN"]
+
+# Complex name patterns as one alternation (plain substring matches)
+COMPLEX_NAME_PATTERN = re.compile("|".join(map(re.escape, COMPLEX_NAME_PATTERNS)))
+
+# Characters removed from amount strings before parsing ("$1,234" -> "1234")
+AMOUNT_STRIP_TABLE = str.maketrans("", "", "$, ")
+
+# Columns appended to the input columns in every output file
+REFINEMENT_COLUMNS = [
+    "engagement_score", "engagement_reason", "equity_estimate",
+    "has_email", "has_phone", "contact_quality"
+]
+
+
+class InputRow(NamedTuple):
+    """Input columns used for scoring (fields are named after the CSV columns)."""
+    email: str
+    Email: str
+    phone: str
+    Phone: str
+    mailing_address: str
+    mailing_city: str
+    mailing_state: str
+    situs_address: str
+    situs_city: str
+    situs_state: str
+    property_count: str
+    total_value: str
+    improvement_value: str
+    full_name: str
+    company_name: str
+
+
+class RowFeatures(NamedTuple):
+    """Per-row checks shared by scoring, classification and the output columns."""
+    has_email: bool
+    has_phone: bool
+    has_street_address: bool
+    total_value: Optional[float]
+    equity: Optional[float]
+
 
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
 
 def parse_amount(amount_str: str) -> Optional[float]:
-    """Parse amount from string."""
-    if not amount_str or not amount_str.strip():
+    """Parse amount from string (plain numbers skip the "$1,234" cleanup)."""
+    if not amount_str:
         return None
     
-    cleaned = amount_str.strip().replace("$", "").replace(",", "").replace(" ", "")
+    try:
+        return float(amount_str)
+    except ValueError:
+        pass
     
     try:
-        return float(cleaned)
-    except (ValueError, AttributeError):
+        return float(amount_str.translate(AMOUNT_STRIP_TABLE))
+    except ValueError:
         return None
 
 
-def has_email(row: Dict[str, str]) -> bool:
+def has_email(row: InputRow) -> bool:
     """Check if row has email address."""
     # Check both 'email' and 'Email' columns (case insensitive)
-    email = row.get("email", "") or row.get("Email", "")
+    email = row.email or row.Email
     email = email.strip()
     return bool(email and "@" in email)
 
 
-def has_phone(row: Dict[str, str]) -> bool:
+def has_phone(row: InputRow) -> bool:
     """Check if row has phone number."""
     # Check both 'phone' and 'Phone' columns (case insensitive)
-    phone = row.get("phone", "") or row.get("Phone", "")
+    phone = row.phone or row.Phone
     phone = phone.strip()
     return bool(phone and len(phone) >= 10)
 
@@ -86,47 +141,42 @@ def is_street_address(address: str) -> bool:
     if not address:
         return False
     
-    address_upper = address.upper()
-    po_box_indicators = ["PO BOX", "P.O. BOX", "P O BOX", "POBOX", "BOX ", "PMB", "SUITE"]
-    return not any(indicator in address_upper for indicator in po_box_indicators)
+    return PO_BOX_PATTERN.search(address.upper()) is None
 
 
-def is_strong_absentee(row: Dict[str, str]) -> bool:
-    """Check if owner is strongly absentee (different city/state)."""
-    mailing_city = row.get("mailing_city", "").strip().upper()
-    mailing_state = row.get("mailing_state", "").strip().upper()
-    situs_city = row.get("situs_city", "").strip().upper()
-    situs_state = row.get("situs_state", "").strip().upper()
-    
-    if not mailing_city or not situs_city:
-        return False
-    
-    # Different state = strong absentee
-    if mailing_state and situs_state and mailing_state != situs_state:
-        return True
-    
-    # Different city = strong absentee
-    if mailing_city != situs_city:
-        return True
-    
-    return False
-
-
-def is_weak_absentee(row: Dict[str, str]) -> bool:
-    """Check if owner is weakly absentee (same city, different address)."""
-    mailing_address = row.get("mailing_address", "").strip().upper()
-    situs_address = row.get("situs_address", "").strip().upper()
-    mailing_city = row.get("mailing_city", "").strip().upper()
-    situs_city = row.get("situs_city", "").strip().upper()
+def get_absentee_status(row: InputRow) -> Optional[str]:
+    """
+    Check absentee status, stripping and uppercasing each location column
+    at most once (addresses are only read when the cities match).
     
-    if not mailing_address or not situs_address:
-        return False
+    Returns:
+        "strong" when the mailing city/state differs from the situs,
+        "weak" when the city matches but the street address differs,
+        None when the owner looks owner-occupied.
+    """
+    mailing_city = row.mailing_city.strip().upper()
+    situs_city = row.situs_city.strip().upper()
+    
+    if mailing_city and situs_city:
+        # Different state = strong absentee
+        mailing_state = row.mailing_state.strip().upper()
+        situs_state = row.situs_state.strip().upper()
+        if mailing_state and situs_state and mailing_state != situs_state:
+            return "strong"
+        
+        # Different city = strong absentee
+        if mailing_city != situs_city:
+            return "strong"
+    elif mailing_city != situs_city:
+        return None
     
-    # Same city but different address
-    if mailing_city == situs_city and mailing_address != situs_address:
-        return True
+    # Same city but different address = weak absentee
+    mailing_address = row.mailing_address.strip().upper()
+    situs_address = row.situs_address.strip().upper()
+    if mailing_address and situs_address and mailing_address != situs_address:
+        return "weak"
     
-    return False
+    return None
 
 
 def is_simple_name(name: str) -> bool:
@@ -138,21 +188,15 @@ def is_simple_name(name: str) -> bool:
     if len(name) > 60:
         return False
     
-    complex_patterns = ["TRUST", "ESTATE", "HEIRS", "ET AL", "ETC", "UNKNOWN"]
-    name_upper = name.upper()
-    
-    return not any(pattern in name_upper for pattern in complex_patterns)
+    return COMPLEX_NAME_PATTERN.search(name.upper()) is None
 
 
-def estimate_equity(row: Dict[str, str]) -> Optional[float]:
+def estimate_equity(total_value: Optional[float], improvement_value: Optional[float]) -> Optional[float]:
     """
     Rough equity estimate: total_value - improvement_value.
     
     This assumes land value represents equity potential.
     """
-    total_value = parse_amount(row.get("total_value", ""))
-    improvement_value = parse_amount(row.get("improvement_value", ""))
-    
     if total_value is None:
         return None
     
@@ -173,7 +217,21 @@ def is_in_note_sweet_spot(total_value: Optional[float]) -> bool:
     return NOTE_SWEET_SPOT_MIN <= total_value <= NOTE_SWEET_SPOT_MAX
 
 
-def calculate_engagement_score(row: Dict[str, str]) -> Tuple[int, str]:
+def get_row_features(row: InputRow) -> RowFeatures:
+    """Run the contact and value checks once for a row."""
+    total_value = parse_amount(row.total_value)
+    improvement_value = parse_amount(row.improvement_value)
+    
+    return RowFeatures(
+        has_email=has_email(row),
+        has_phone=has_phone(row),
+        has_street_address=is_street_address(row.mailing_address),
+        total_value=total_value,
+        equity=estimate_equity(total_value, improvement_value)
+    )
+
+
+def calculate_engagement_score(row: InputRow, features: RowFeatures) -> Tuple[int, str]:
     """
     Calculate engagement score (0-100) for note broker outreach.
     
@@ -183,39 +241,39 @@ def calculate_engagement_score(row: Dict[str, str]) -> Tuple[int, str]:
     reasons = []
     
     # Email presence
-    if has_email(row):
+    if features.has_email:
         score += WEIGHT_EMAIL
         reasons.append("has email")
     else:
         reasons.append("no email")
     
     # Phone presence
-    if has_phone(row):
+    if features.has_phone:
         score += WEIGHT_PHONE
         reasons.append("has phone")
     else:
         reasons.append("no phone")
     
     # Mailing address quality
-    mailing_address = row.get("mailing_address", "")
-    if is_street_address(mailing_address):
+    if features.has_street_address:
         score += WEIGHT_STREET_ADDRESS
         reasons.append("street address")
     else:
         reasons.append("PO box or missing")
     
     # Absentee status
-    if is_strong_absentee(row):
+    absentee_status = get_absentee_status(row)
+    if absentee_status == "strong":
         score += WEIGHT_ABSENTEE_STRONG
         reasons.append("strong absentee")
-    elif is_weak_absentee(row):
+    elif absentee_status == "weak":
         score += WEIGHT_ABSENTEE_WEAK
         reasons.append("weak absentee")
     else:
         reasons.append("owner occupied")
     
     # Multiple properties
-    property_count = int(row.get("property_count", "1") or "1")
+    property_count = int(row.property_count or "1")
     if property_count >= 3:
         score += WEIGHT_MULTIPLE_PROPERTIES
         reasons.append(f"{property_count} properties")
@@ -224,13 +282,12 @@ def calculate_engagement_score(row: Dict[str, str]) -> Tuple[int, str]:
         reasons.append("2 properties")
     
     # Note sweet spot
-    total_value = parse_amount(row.get("total_value", ""))
-    if is_in_note_sweet_spot(total_value):
+    if is_in_note_sweet_spot(features.total_value):
         score += WEIGHT_NOTE_SWEET_SPOT
         reasons.append("note sweet spot value")
     
     # Simple name
-    owner_name = row.get("full_name", "") or row.get("company_name", "")
+    owner_name = row.full_name or row.company_name
     if is_simple_name(owner_name):
         score += WEIGHT_SIMPLE_NAME
         reasons.append("simple name")
@@ -243,35 +300,36 @@ def calculate_engagement_score(row: Dict[str, str]) -> Tuple[int, str]:
     return (score, why_flagged)
 
 
-def classify_for_note_broker(row: Dict[str, str]) -> Tuple[str, int, str]:
+def classify_for_note_broker(row: InputRow) -> Tuple[str, int, str, RowFeatures]:
     """
     Classify row for note broker outreach.
     
     Returns:
-        Tuple of (classification, engagement_score, why_flagged)
+        Tuple of (classification, engagement_score, why_flagged, features).
+        features holds the per-row checks for building the output columns.
     """
+    features = get_row_features(row)
+    
     # Calculate engagement score
-    engagement_score, why_flagged = calculate_engagement_score(row)
+    engagement_score, why_flagged = calculate_engagement_score(row, features)
     
     # Classification logic
-    has_contact_info = has_email(row) or has_phone(row)
-    total_value = parse_amount(row.get("total_value", ""))
-    equity = estimate_equity(row)
+    has_contact_info = features.has_email or features.has_phone
     
     # HIGH PRIORITY: Has contact info + good engagement score
     if has_contact_info and engagement_score >= 60:
-        return ("HIGH_PRIORITY", engagement_score, why_flagged)
+        return ("HIGH_PRIORITY", engagement_score, why_flagged, features)
     
     # MEDIUM PRIORITY: Good engagement score but no contact info (needs enrichment)
     if engagement_score >= 50:
-        return ("MEDIUM_PRIORITY", engagement_score, why_flagged)
+        return ("MEDIUM_PRIORITY", engagement_score, why_flagged, features)
     
     # LOW PRIORITY: Lower engagement score
     if engagement_score >= 30:
-        return ("LOW_PRIORITY", engagement_score, why_flagged)
+        return ("LOW_PRIORITY", engagement_score, why_flagged, features)
     
     # REVIEW: Needs manual review
-    return ("REVIEW", engagement_score, why_flagged)
+    return ("REVIEW", engagement_score, why_flagged, features)
 
 
 def process_targets_file(
@@ -289,13 +347,21 @@ def process_targets_file(
     low_priority_path = output_dir / "note_broker_low_priority.csv"
     review_path = output_dir / "note_broker_review.csv"
     
-    # Read input file to get columns
-    with open(input_path, 'r', encoding='utf-8', errors='replace') as f:
-        reader = csv.DictReader(f)
-        input_columns = list(reader.fieldnames or [])
+    # Open input file and read its columns (rows are streamed from the same handle below)
+    input_file = open(input_path, 'r', encoding='utf-8', errors='replace')
+    reader = csv.reader(input_file)
+    input_columns = next(reader, [])
     
     # Add refinement columns
-    output_columns = input_columns + ["engagement_score", "engagement_reason", "equity_estimate", "has_email", "has_phone", "contact_quality"]
+    output_columns = input_columns + REFINEMENT_COLUMNS
+    
+    # Input columns named like a refinement column (e.g. a re-refined file)
+    # repeat the new value, as they did when rows were written by name
+    repeated_columns = [
+        (i, REFINEMENT_COLUMNS.index(column))
+        for i, column in enumerate(input_columns)
+        if column in REFINEMENT_COLUMNS
+    ]
     
     # Open output files
     high_file = open(high_priority_path, 'w', newline='', encoding='utf-8')
@@ -303,15 +369,15 @@ def process_targets_file(
     low_file = open(low_priority_path, 'w', newline='', encoding='utf-8')
     review_file = open(review_path, 'w', newline='', encoding='utf-8')
     
-    high_writer = csv.DictWriter(high_file, fieldnames=output_columns)
-    medium_writer = csv.DictWriter(medium_file, fieldnames=output_columns)
-    low_writer = csv.DictWriter(low_file, fieldnames=output_columns)
-    review_writer = csv.DictWriter(review_file, fieldnames=output_columns)
-    
-    high_writer.writeheader()
-    medium_writer.writeheader()
-    low_writer.writeheader()
-    review_writer.writeheader()
+    # Writer and count key for each classification
+    outputs = {
+        "HIGH_PRIORITY": (csv.writer(high_file), "high"),
+        "MEDIUM_PRIORITY": (csv.writer(medium_file), "medium"),
+        "LOW_PRIORITY": (csv.writer(low_file), "low"),
+        "REVIEW": (csv.writer(review_file), "review"),
+    }
+    for writer, _ in outputs.values():
+        writer.writerow(output_columns)
     
     # Process rows
     counts = {"high": 0, "medium": 0, "low": 0, "review": 0}
@@ -321,54 +387,70 @@ def process_targets_file(
         print("Enriched file detected - email/phone scoring enabled")
     print()
     
-    with open(input_path, 'r', encoding='utf-8', errors='replace') as f:
-        reader = csv.DictReader(f)
+    # Column positions, resolved once from the header. A repeated column name
+    # reads its last occurrence (as csv.DictReader did); missing columns and
+    # short rows read as blank from the padding at index width.
+    width = len(input_columns)
+    column_index = {column: i for i, column in enumerate(input_columns)}
+    get_fields = itemgetter(*[column_index.get(field, width) for field in InputRow._fields])
+    make_row = InputRow._make
+    get_input_values = None
+    if len(column_index) < width:
+        get_input_values = itemgetter(*[column_index[column] for column in input_columns])
+    
+    rows = (row for row in reader if row)  # Skip blank lines (as csv.DictReader does)
+    
+    for row_num, row in enumerate(rows, start=2):
+        if len(row) <= width:
+            row += [""] * (width + 1 - len(row))
+        else:
+            # Drop fields past the header (csv.DictReader kept them under
+            # None) so the padding slot stays blank
+            row[width:] = [""]
+        
+        # Classify for note broker
+        classification, engagement_score, why_flagged, features = classify_for_note_broker(
+            make_row(get_fields(row))
+        )
+        
+        # Contact quality
+        contact_quality = []
+        if features.has_email:
+            contact_quality.append("EMAIL")
+        if features.has_phone:
+            contact_quality.append("PHONE")
+        if features.has_street_address:
+            contact_quality.append("STREET_ADDRESS")
+        
+        # Refinement fields (values in REFINEMENT_COLUMNS order)
+        equity = features.equity
+        refinement_values = [
+            str(engagement_score),
+            why_flagged,
+            f"{equity:,.0f}" if equity else "",
+            "Y" if features.has_email else "N",
+            "Y" if features.has_phone else "N",
+            " | ".join(contact_quality) if contact_quality else "NONE"
+        ]
+        
+        # Build output row (values in output_columns order)
+        output_row = row[:width] if get_input_values is None else list(get_input_values(row))
+        for i, refinement_index in repeated_columns:
+            output_row[i] = refinement_values[refinement_index]
+        output_row += refinement_values
+        
+        # Write to appropriate file
+        writer, count_key = outputs[classification]
+        writer.writerow(output_row)
+        counts[count_key] += 1
         
-        for row_num, row in enumerate(reader, start=2):
-            # Classify for note broker
-            classification, engagement_score, why_flagged = classify_for_note_broker(row)
-            
-            # Add refinement fields
-            enriched_row = dict(row)
-            enriched_row["engagement_score"] = str(engagement_score)
-            enriched_row["engagement_reason"] = why_flagged
-            
-            equity = estimate_equity(row)
-            enriched_row["equity_estimate"] = f"{equity:,.0f}" if equity else ""
-            
-            enriched_row["has_email"] = "Y" if has_email(row) else "N"
-            enriched_row["has_phone"] = "Y" if has_phone(row) else "N"
-            
-            # Contact quality
-            contact_quality = []
-            if has_email(row):
-                contact_quality.append("EMAIL")
-            if has_phone(row):
-                contact_quality.append("PHONE")
-            if is_street_address(row.get("mailing_address", "")):
-                contact_quality.append("STREET_ADDRESS")
-            enriched_row["contact_quality"] = " | ".join(contact_quality) if contact_quality else "NONE"
-            
-            # Write to appropriate file
-            if classification == "HIGH_PRIORITY":
-                high_writer.writerow(enriched_row)
-                counts["high"] += 1
-            elif classification == "MEDIUM_PRIORITY":
-                medium_writer.writerow(enriched_row)
-                counts["medium"] += 1
-            elif classification == "LOW_PRIORITY":
-                low_writer.writerow(enriched_row)
-                counts["low"] += 1
-            else:  # REVIEW
-                review_writer.writerow(enriched_row)
-                counts["review"] += 1
-            
-            # Progress update
-            if row_num % 50000 == 0:
-                print(f"Processed {row_num:,} rows... (high: {counts['high']:,}, "
-                      f"medium: {counts['medium']:,}, low: {counts['low']:,}, review: {counts['review']:,})")
+        # Progress update
+        if row_num % 50000 == 0:
+            print(f"Processed {row_num:,} rows... (high: {counts['high']:,}, "
+                  f"medium: {counts['medium']:,}, low: {counts['low']:,}, review: {counts['review']:,})")
     
     # Close files
+    input_file.close()
     high_file.close()
     medium_file.close()
     low_file.close()
@@ -16,7 +16,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from column_mapper import map_columns, save_mapping
 from filter_private_notes import process_recorder_file
-from join_tcad import load_tcad_lookup, enrich_leads_with_tcad
+from join_tcad import collect_lead_account_ids, load_tcad_lookup, enrich_leads_with_tcad
 
 
 def main():
@@ -110,7 +110,9 @@ Examples:
     if tcad_path and tcad_path.exists() and leads_path.exists():
         print("STEP 3: Enriching leads with TCAD data...")
         print("-" * 70)
-        tcad_lookup = load_tcad_lookup(tcad_path)
+        # Only keep TCAD rows for accounts referenced by the leads
+        account_ids = collect_lead_account_ids(leads_path, column_mapping)
+        tcad_lookup = load_tcad_lookup(tcad_path, account_ids)
         if tcad_lookup:
             enrich_leads_with_tcad(
                 leads_path=leads_path,
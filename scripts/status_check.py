@@ -56,53 +56,94 @@ def analyze_email_ready(file_path: Path) -> Dict:
     if not file_path.exists():
         return stats
     
-    lead_scores = []
+    # Per-value counts are kept in plain dicts in the row loop (a bound .get
+    # is cheaper than Counter item updates) and stored as Counters afterwards.
+    # Lead scores are counted per distinct value and summarized after the loop.
+    owner_type_counts = {}
+    doc_type_counts = {}
+    lead_score_counts = {}
+    owner_type_get = owner_type_counts.get
+    doc_type_get = doc_type_counts.get
+    lead_score_get = lead_score_counts.get
     
     with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-        reader = csv.DictReader(f)
+        reader = csv.reader(f)
+        header = next(reader, [])
+        
+        # Column positions, resolved once from the header. A repeated column
+        # name reads its last occurrence (as csv.DictReader did); missing
+        # columns and short rows read as blank from the padding at index width
+        # (rows are cut or padded to width + 1 fields).
+        width = len(header)
+        column_index = {column: i for i, column in enumerate(header)}
+        owner_type_idx, doc_type_idx, lead_score_idx, email_idx, tcad_id_idx, lead_id_idx = (
+            column_index.get(column, width)
+            for column in ("owner_type", "doc_type", "lead_score", "email", "tcad_account_id", "lead_id")
+        )
         
         for row in reader:
+            if not row:
+                continue  # Skip blank lines (as csv.DictReader does)
+            if len(row) <= width:
+                row += [""] * (width + 1 - len(row))
+            else:
+                # Drop fields past the header (csv.DictReader kept them under
+                # None) so the padding slot stays blank
+                row[width:] = [""]
+            
             stats["total_rows"] += 1
             
             # Owner type
-            owner_type = row.get("owner_type", "UNKNOWN")
-            stats["owner_type_counts"][owner_type] += 1
+            owner_type = row[owner_type_idx]
+            owner_type_counts[owner_type] = owner_type_get(owner_type, 0) + 1
             
             # Doc type
-            doc_type = row.get("doc_type", "")
+            doc_type = row[doc_type_idx]
             if doc_type:
-                stats["doc_type_counts"][doc_type] += 1
+                doc_type_counts[doc_type] = doc_type_get(doc_type, 0) + 1
             
             # Lead score
-            lead_score_str = row.get("lead_score", "")
+            lead_score_str = row[lead_score_idx]
             if lead_score_str:
-                try:
-                    score = int(lead_score_str)
-                    lead_scores.append(score)
-                    stats["lead_score_stats"]["min"] = min(stats["lead_score_stats"]["min"], score)
-                    stats["lead_score_stats"]["max"] = max(stats["lead_score_stats"]["max"], score)
-                except ValueError:
-                    pass
+                lead_score_counts[lead_score_str] = lead_score_get(lead_score_str, 0) + 1
             
             # Email
-            email = row.get("email", "").strip()
-            if not email:
+            if not row[email_idx].strip():
                 stats["missing_email_count"] += 1
             
             # TCAD match
-            tcad_id = row.get("tcad_account_id", "").strip()
-            if tcad_id:
+            if row[tcad_id_idx].strip():
                 stats["has_tcad_match_count"] += 1
             
             # Sample lead IDs
             if len(stats["sample_lead_ids"]) < 5:
-                lead_id = row.get("lead_id", "")
+                lead_id = row[lead_id_idx]
                 if lead_id:
                     stats["sample_lead_ids"].append(lead_id)
     
+    stats["owner_type_counts"] = Counter(owner_type_counts)
+    stats["doc_type_counts"] = Counter(doc_type_counts)
+    
+    # Without an owner_type column every row counts as UNKNOWN
+    if "owner_type" not in column_index and stats["total_rows"]:
+        stats["owner_type_counts"] = Counter({"UNKNOWN": stats["total_rows"]})
+    
+    # Lead score min/max/avg over the distinct values (non-numeric scores are skipped)
+    score_total = 0
+    score_count = 0
+    for lead_score_str, count in lead_score_counts.items():
+        try:
+            score = int(lead_score_str)
+        except ValueError:
+            continue
+        stats["lead_score_stats"]["min"] = min(stats["lead_score_stats"]["min"], score)
+        stats["lead_score_stats"]["max"] = max(stats["lead_score_stats"]["max"], score)
+        score_total += score * count
+        score_count += count
+    
     # Calculate average lead score
-    if lead_scores:
-        stats["lead_score_stats"]["avg"] = sum(lead_scores) / len(lead_scores)
+    if score_count:
+        stats["lead_score_stats"]["avg"] = score_total / score_count
     else:
         stats["lead_score_stats"] = {"min": 0, "max": 0, "avg": 0}
     